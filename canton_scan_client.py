@@ -1,8 +1,175 @@
 import requests
+import types
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Optional, List, Dict, Any, Union, TypedDict, Tuple
 from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from urllib.parse import urlencode
+import asyncio
 import csv
+from calendar import monthrange
+import functools
+import json
+import logging
+import sqlite3
 import sys
+import threading
+import time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# httpx raises ImportError at client construction for http2=True unless it
+# was installed with the http2 extra; check for h2 up front so a bare
+# `pip install httpx` does not break ScanApiClient().
+try:
+    import h2  # noqa: F401
+    _HAS_H2 = True
+except ImportError:
+    _HAS_H2 = False
+
+try:
+    import ijson  # picks the fastest available backend (yajl2_c when installed)
+except ImportError:
+    ijson = None
+
+# urllib3/httpx only decode brotli bodies when one of these is importable;
+# advertising br without a decoder would hand _loads compressed bytes.
+try:
+    import brotli  # noqa: F401
+    _HAS_BROTLI = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        _HAS_BROTLI = True
+    except ImportError:
+        _HAS_BROTLI = False
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+    njit = None
+
+
+if httpx is not None:
+    class _StatusRetryTransport(httpx.HTTPTransport):
+        """
+        HTTPTransport whose retries= only covers connect errors; this adds
+        retries on 502/503/504 with exponential backoff so the httpx path
+        keeps the same policy as the urllib3 Retry(status_forcelist=...)
+        mounted on the requests path.
+        """
+
+        _RETRY_STATUSES = frozenset((502, 503, 504))
+
+        def handle_request(self, request):
+            for attempt in range(3):
+                response = super().handle_request(request)
+                if response.status_code not in self._RETRY_STATUSES:
+                    return response
+                response.close()
+                time.sleep(0.2 * (2 ** attempt))
+            return super().handle_request(request)
+
+
+def _scan_month_bounds(rounds, years, months, year, month):
+    """
+    Single linear pass over pre-parsed (round, year, month) arrays returning
+    the (first_round, last_round) matching the target month, or (-1, -1).
+    Branch-light on purpose so numba can compile it to a tight loop.
+    """
+    first = -1
+    last = -1
+    for i in range(len(rounds)):
+        if years[i] == year and months[i] == month:
+            if first < 0:
+                first = rounds[i]
+            last = rounds[i]
+    return first, last
+
+
+if njit is not None:
+    _scan_month_bounds = njit(cache=True, fastmath=True)(_scan_month_bounds)
+
+# JSON codec: orjson parses response bytes directly in C (no bytes -> str
+# round-trip) and is a drop-in for the payload shapes this client handles;
+# fall back to the stdlib when it is not installed.
+if orjson is not None:
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+else:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        # Compact separators match orjson's output and skip the per-item
+        # space padding stdlib json emits by default.
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Several methods take a `csv: bool` flag that shadows the module name.
+_csv = csv
+
+logger = logging.getLogger(__name__)
+
+# Per-receiver and per-balance-change columns emitted by the activities
+# export for each expanded transfer slot.
+_RECEIVER_KEYS = ("party", "amount", "receiver_fee")
+_BALANCE_CHANGE_KEYS = ("party", "change_to_initial_amount_as_of_round_zero", "change_to_holding_fees_rate")
+
+# Spellings of the round-totals effective-at field across backend versions,
+# in the order they should be tried.
+_EFFECTIVE_AT_KEYS = ("closed_round_effective_at", "effectiveAt", "effective_at")
+
+
+def _effective_at_key(entries: Any) -> Optional[str]:
+    """Detect which effective-at spelling this backend uses, from the first
+    entry that carries one."""
+    for entry in entries:
+        for key in _EFFECTIVE_AT_KEYS:
+            if entry.get(key):
+                return key
+    return None
+
+
+def _round_effective_times(entries: Any) -> Dict[int, str]:
+    """Build {closed_round: effective_at} for a batch of round-totals entries,
+    detecting the key spelling once instead of three .get fallbacks per row."""
+    key = _effective_at_key(entries)
+    if key is None:
+        return {}
+    out: Dict[int, str] = {}
+    for entry in entries:
+        round_num = entry.get("closed_round")
+        eff_time = entry.get(key)
+        if round_num is not None and eff_time:
+            out[round_num] = eff_time
+    return out
+
+
+# Transport errors worth retrying, for whichever HTTP client is in use.
+_TRANSPORT_ERRORS: Tuple[type, ...] = (requests.RequestException,)
+if httpx is not None:
+    _TRANSPORT_ERRORS = _TRANSPORT_ERRORS + (httpx.HTTPError,)
+
+# Optional request-field names for the paginated/hot helpers, hoisted so the
+# per-call dict comprehensions do not rebuild the key tuples each iteration.
+_LICENSES_PARAMS = ("after", "limit")
+_UPDATE_HISTORY_V1_FIELDS = ("after", "page_size", "daml_value_encoding")
+_HOLDINGS_STATE_FIELDS = ("record_time", "after", "page_size", "owner_party_ids")
+_HOLDINGS_SUMMARY_FIELDS = ("record_time", "owner_party_ids", "as_of_round")
+_ANS_ENTRIES_PARAMS = ("name_prefix", "page_size")
 
 class ValidatorLicenseFaucetState(TypedDict):
     firstReceivedFor: Dict[str, str]
@@ -42,6 +209,42 @@ class RoundTotalEntry(TypedDict):
     cumulative_change_to_holding_fees_rate: str
     total_amulet_balance: str
 
+_ROUND_TOTAL_FIELDS = tuple(RoundTotalEntry.__annotations__)
+
+
+@dataclass(slots=True, frozen=True)
+class RoundTotalRow:
+    """
+    Slotted, immutable counterpart of RoundTotalEntry for scan-heavy work:
+    a plain dict costs a few hundred bytes per row, which adds up when whole
+    round ranges are held in memory. Built positionally from the TypedDict
+    field order.
+    """
+    closed_round: int
+    closed_round_effective_at: str
+    app_rewards: str
+    validator_rewards: str
+    change_to_initial_amount_as_of_round_zero: str
+    change_to_holding_fees_rate: str
+    cumulative_app_rewards: str
+    cumulative_validator_rewards: str
+    cumulative_change_to_initial_amount_as_of_round_zero: str
+    cumulative_change_to_holding_fees_rate: str
+    total_amulet_balance: str
+
+
+@dataclass(slots=True, frozen=True)
+class WalletBalanceForMonthRow:
+    """Slotted counterpart of WalletBalanceForMonth for large party sweeps."""
+    party_id: str
+    beginning_of_month_round: int
+    beginning_of_month_time: Optional[str]
+    beginning_of_month_balance: Optional[str]
+    end_of_month_round: int
+    end_of_month_time: Optional[str]
+    end_of_month_balance: Optional[str]
+
+
 class WalletBalanceResponse(TypedDict):
     wallet_balance: str
 
@@ -96,44 +299,227 @@ class HoldingsSummaryResponse(TypedDict):
     summaries: List[HoldingsSummaryEntry]
 
 class ScanApiClient:
-    def __init__(self, base_url: str, token: Optional[str] = None):
+    # Round totals are fetched and cached in aligned batches of this size.
+    _ROUND_BATCH_SIZE = 200
+
+    def __init__(self, base_url: str, token: Optional[str] = None,
+                 disk_cache_path: Optional[str] = ".canton_cache.sqlite3",
+                 latest_round_ttl: float = 5.0,
+                 http2: bool = True):
         self.base_url = base_url.rstrip("/")
-        self.session = requests.Session()
+        if httpx is not None and _HAS_H2 and http2:
+            # HTTP/2 multiplexes the high-fanout loops (per-round balances,
+            # batch searches) over one TLS connection instead of one socket
+            # per in-flight request. Requires the h2 package (httpx's http2
+            # extra); without it we fall through to the requests path below.
+            self.session = httpx.Client(
+                http2=True,
+                transport=_StatusRetryTransport(
+                    http2=True,
+                    retries=3,
+                    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+                ),
+                timeout=30.0,
+            )
+            # httpx takes raw bodies as content=, requests as data=; bind the
+            # difference once here so the POST helpers stay branch-free.
+            self._post_raw = lambda url, body: self.session.post(
+                url, content=body, headers=_JSON_HEADERS
+            )
+        else:
+            self.session = requests.Session()
+            # Reuse keep-alive sockets across the many small requests this client
+            # makes (binary searches, per-round loops) instead of re-handshaking.
+            adapter = HTTPAdapter(
+                pool_connections=32,
+                pool_maxsize=64,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.2,
+                    status_forcelist=(502, 503, 504),
+                    allowed_methods=frozenset(["GET", "POST"]),
+                ),
+            )
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+            self.session.headers["Connection"] = "keep-alive"
+            self._post_raw = lambda url, body: self.session.post(
+                url, data=body, headers=_JSON_HEADERS
+            )
+        # The text-heavy JSON here compresses 5-10x; only offer br when a
+        # brotli decoder is actually importable.
+        self.session.headers["Accept-Encoding"] = (
+            "br, gzip, deflate" if _HAS_BROTLI else "gzip, deflate"
+        )
+        # URLs are assembled once here so the per-call helpers skip the
+        # f-string concatenation on every request.
+        base = self.base_url
+        self._url = types.SimpleNamespace(
+            readyz=base + "/readyz",
+            livez=base + "/livez",
+            status=base + "/status",
+            version=base + "/version",
+            dso=base + "/v0/dso",
+            validator_faucets=base + "/v0/validators/validator-faucets",
+            scans=base + "/v0/scans",
+            validator_licenses=base + "/v0/admin/validator/licenses",
+            dso_sequencers=base + "/v0/dso-sequencers",
+            closed_rounds=base + "/v0/closed-rounds",
+            open_and_issuing_mining_rounds=base + "/v0/open-and-issuing-mining-rounds",
+            updates_v1=base + "/v1/updates",
+            acs_snapshot_timestamp=base + "/v0/state/acs/snapshot-timestamp",
+            acs=base + "/v0/state/acs",
+            acs_force=base + "/v0/state/acs/force",
+            holdings_state=base + "/v0/holdings/state",
+            holdings_summary=base + "/v0/holdings/summary",
+            ans_entries=base + "/v0/ans-entries",
+            dso_party_id=base + "/v0/dso-party-id",
+            amulet_rules=base + "/v0/amulet-rules",
+            external_party_amulet_rules=base + "/v0/external-party-amulet-rules",
+            ans_rules=base + "/v0/ans-rules",
+            featured_apps=base + "/v0/featured-apps",
+            top_validators_by_validator_faucets=base + "/v0/top-validators-by-validator-faucets",
+            transfer_command_status=base + "/v0/transfer-command/status",
+            migration_schedule=base + "/v0/migrations/schedule",
+            splice_instance_names=base + "/v0/splice-instance-names",
+            amulet_price_votes=base + "/v0/amulet-price/votes",
+            voterequest=base + "/v0/voterequest",
+            admin_voterequests=base + "/v0/admin/sv/voterequests",
+            admin_voteresults=base + "/v0/admin/sv/voteresults",
+            migration_info=base + "/v0/backfilling/migration-info",
+            updates_before=base + "/v0/backfilling/updates-before",
+            aggregated_rounds=base + "/v0/aggregated-rounds",
+            round_totals=base + "/v0/round-totals",
+            round_party_totals=base + "/v0/round-party-totals",
+            total_amulet_balance=base + "/v0/total-amulet-balance",
+            wallet_balance=base + "/v0/wallet-balance",
+            amulet_config_for_round=base + "/v0/amulet-config-for-round",
+            round_of_latest_data=base + "/v0/round-of-latest-data",
+            rewards_collected=base + "/v0/rewards-collected",
+            top_providers_by_app_rewards=base + "/v0/top-providers-by-app-rewards",
+            top_validators_by_validator_rewards=base + "/v0/top-validators-by-validator-rewards",
+            top_validators_by_purchased_traffic=base + "/v0/top-validators-by-purchased-traffic",
+            activities=base + "/v0/activities",
+            transactions=base + "/v0/transactions",
+            updates=base + "/v0/updates",
+            feature_support=base + "/v0/feature-support",
+        )
+        self._tpl_participant_id = self.base_url + "/v0/domains/{}/parties/{}/participant-id"
+        self._tpl_traffic_status = self.base_url + "/v0/domains/{}/members/{}/traffic-status"
+        self._tpl_update_by_id_v1 = self.base_url + "/v1/updates/{}"
+        self._tpl_ans_entry_by_party = self.base_url + "/v0/ans-entries/by-party/{}"
+        self._tpl_ans_entry_by_name = self.base_url + "/v0/ans-entries/by-name/{}"
+        self._tpl_featured_app_right = self.base_url + "/v0/featured-apps/{}"
+        self._tpl_transfer_preapproval_by_party = self.base_url + "/v0/transfer-preapprovals/by-party/{}"
+        self._tpl_transfer_command_counter = self.base_url + "/v0/transfer-command-counter/{}"
+        self._tpl_synchronizer_identities = self.base_url + "/v0/synchronizer-identities/{}"
+        self._tpl_synchronizer_bootstrapping = self.base_url + "/v0/synchronizer-bootstrapping-transactions/{}"
+        self._tpl_vote_request = self.base_url + "/v0/voterequests/{}"
+        self._tpl_acs_snapshot = self.base_url + "/v0/acs/{}"
+        self._tpl_update_by_id = self.base_url + "/v0/updates/{}"
+        # Per-instance cache: the binary searches in find_rounds_for_month
+        # revisit the same 200-round batches many times.
+        self._fetch_round_batch = functools.lru_cache(maxsize=128)(self._fetch_round_batch_uncached)
+        # ACS snapshot timestamps and round-totals batches are immutable once
+        # resolved; memoizing them lets overlapping month calls and reruns
+        # skip the repeat round-trips.
+        self._cached_acs_snapshot = functools.lru_cache(maxsize=4096)(self.get_acs_snapshot_timestamp)
+        self._cached_round_totals_batch = functools.lru_cache(maxsize=4096)(self._round_totals_batch_uncached)
+        # Accumulated round -> effective_time map shared by the per-range
+        # balance methods; overlapping queries only fetch the gaps.
+        self._effective_time_cache: Dict[int, str] = {}
+        # Batch starts we have already fetched, so cheap cache-only rechecks
+        # can be told apart from probes that would cost a network round-trip.
+        self._fetched_batches: set = set()
+        # Per-batch (rounds, years, months) arrays for the vectorized month
+        # scan; kept alongside the lru_cache so they survive its evictions.
+        self._ym_by_batch: Dict[int, Tuple[Any, Any, Any]] = {}
+        # Warm tier under the in-memory batch cache: closed rounds are
+        # immutable, so fully-past batches persist across runs on disk.
+        # Pass disk_cache_path=None to disable.
+        self._disk_cache_path = disk_cache_path
+        self._disk_conn: Optional[sqlite3.Connection] = None
+        self._disk_lock = threading.Lock()
+        self._latest_round_seen: Optional[int] = None
+        # Report jobs call get_round_of_latest_data from several helpers in
+        # quick succession; within the TTL they all share one answer. Rounds
+        # advance on a many-second cadence, so a few seconds of staleness is
+        # harmless - per-round queries still hit the real endpoints.
+        self._latest_round_ttl = latest_round_ttl
+        self._latest_round_cache: Optional[Tuple[float, RoundOfLatestDataResponse]] = None
         if token:
             self.session.headers.update({"Authorization": f"Bearer {token}"})
 
+    @staticmethod
+    def _json(response: requests.Response) -> Any:
+        """Decode a response body straight from bytes with the fast JSON codec."""
+        return _loads(response.content)
+
+    def _get_json(self, url: str, **kwargs: Any) -> Any:
+        """GET a hot endpoint: status-checked, bytes decoded without the
+        intermediate text/encoding-detection pass."""
+        response = self.session.get(url, **kwargs)
+        response.raise_for_status()
+        return _loads(response.content)
+
+    def _post_json(self, url: str, payload: Dict[str, Any]) -> Any:
+        """POST a pre-encoded JSON body to a hot endpoint, status-checked."""
+        response = self._post_raw(url, _dumps(payload))
+        response.raise_for_status()
+        return _loads(response.content)
+
     def readyz(self) -> Dict[str, Any]:
         """GET /readyz - Health check."""
-        return self.session.get(f"{self.base_url}/readyz").json()
+        return self._json(self.session.get(self._url.readyz))
 
     def livez(self) -> Dict[str, Any]:
         """GET /livez - Liveness check."""
-        return self.session.get(f"{self.base_url}/livez").json()
+        return self._json(self.session.get(self._url.livez))
 
     def status(self) -> Dict[str, Any]:
         """GET /status - Status info."""
-        return self.session.get(f"{self.base_url}/status").json()
+        return self._json(self.session.get(self._url.status))
 
     def version(self) -> Dict[str, Any]:
         """GET /version - Version info."""
-        return self.session.get(f"{self.base_url}/version").json()
+        return self._json(self.session.get(self._url.version))
 
     def get_dso_info(self) -> Dict[str, Any]:
         """GET /v0/dso - DSO info."""
-        return self.session.get(f"{self.base_url}/v0/dso").json()
+        return self._json(self.session.get(self._url.dso))
 
     def get_validator_faucets_by_validator(self, validator_ids: List[str]) -> Dict[str, Any]:
         """
         GET /v0/validators/validator-faucets
         Input: validator_ids: List of validator party IDs.
         Output: JSON with validator faucet stats.
-        """
-        params = [("validator_ids", vid) for vid in validator_ids]
-        return self.session.get(f"{self.base_url}/v0/validators/validator-faucets", params=params).json()
+        Encodes the query string once (skipping requests' per-call param
+        processing) and fans out chunks of 100 ids in parallel for large lists.
+        """
+        def fetch(ids: List[str]) -> Dict[str, Any]:
+            qs = urlencode([("validator_ids", vid) for vid in ids])
+            return self._json(self.session.get(f"{self._url.validator_faucets}?{qs}"))
+
+        chunk = 100
+        if len(validator_ids) <= chunk:
+            return fetch(validator_ids)
+
+        chunks = [validator_ids[i:i + chunk] for i in range(0, len(validator_ids), chunk)]
+        with ThreadPoolExecutor(max_workers=min(8, len(chunks))) as ex:
+            responses = list(ex.map(fetch, chunks))
+        # Merge chunk responses client-side by concatenating list-valued fields.
+        merged: Dict[str, Any] = {}
+        for resp in responses:
+            for key, value in resp.items():
+                if isinstance(value, list) and isinstance(merged.get(key), list):
+                    merged[key].extend(value)
+                else:
+                    merged[key] = value
+        return merged
 
     def list_dso_scans(self) -> Dict[str, Any]:
         """GET /v0/scans - List DSO scans."""
-        return self.session.get(f"{self.base_url}/v0/scans").json()
+        return self._json(self.session.get(self._url.scans))
 
     def list_validator_licenses(self, after: Optional[int] = None, limit: Optional[int] = None) -> Dict[str, Any]:
         """
@@ -141,16 +527,12 @@ class ScanApiClient:
         Input: after: next_page_token, limit: max elements.
         Output: JSON with validator licenses.
         """
-        params = {}
-        if after is not None:
-            params["after"] = after
-        if limit is not None:
-            params["limit"] = limit
-        return self.session.get(f"{self.base_url}/v0/admin/validator/licenses", params=params).json()
+        params = {k: v for k, v in zip(_LICENSES_PARAMS, (after, limit)) if v is not None}
+        return self._json(self.session.get(self._url.validator_licenses, params=params))
 
     def list_dso_sequencers(self) -> Dict[str, Any]:
         """GET /v0/dso-sequencers - List DSO sequencers."""
-        return self.session.get(f"{self.base_url}/v0/dso-sequencers").json()
+        return self._json(self.session.get(self._url.dso_sequencers))
 
     def get_party_to_participant(self, domain_id: str, party_id: str) -> Dict[str, Any]:
         """
@@ -158,7 +540,7 @@ class ScanApiClient:
         Input: domain_id, party_id
         Output: JSON with participant ID.
         """
-        return self.session.get(f"{self.base_url}/v0/domains/{domain_id}/parties/{party_id}/participant-id").json()
+        return self._json(self.session.get(self._tpl_participant_id.format(domain_id, party_id)))
 
     def get_member_traffic_status(self, domain_id: str, member_id: str) -> Dict[str, Any]:
         """
@@ -166,11 +548,11 @@ class ScanApiClient:
         Input: domain_id, member_id
         Output: JSON with traffic status.
         """
-        return self.session.get(f"{self.base_url}/v0/domains/{domain_id}/members/{member_id}/traffic-status").json()
+        return self._json(self.session.get(self._tpl_traffic_status.format(domain_id, member_id)))
 
     def get_closed_rounds(self) -> Dict[str, Any]:
         """GET /v0/closed-rounds - List closed mining rounds."""
-        return self.session.get(f"{self.base_url}/v0/closed-rounds").json()
+        return self._json(self.session.get(self._url.closed_rounds))
 
     def get_open_and_issuing_mining_rounds(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -178,7 +560,7 @@ class ScanApiClient:
         Input: data: JSON body (contract IDs, etc.)
         Output: JSON with mining rounds.
         """
-        return self.session.post(f"{self.base_url}/v0/open-and-issuing-mining-rounds", json=data).json()
+        return self._json(self._post_raw(self._url.open_and_issuing_mining_rounds, _dumps(data)))
 
     def get_update_history_v1(
         self,
@@ -203,14 +585,12 @@ class ScanApiClient:
             "daml_value_encoding": "compact_json"
         }
         """
-        data: Dict[str, Any] = {}
-        if after is not None:
-            data["after"] = after
-        if page_size is not None:
-            data["page_size"] = page_size
-        if daml_value_encoding is not None:
-            data["daml_value_encoding"] = daml_value_encoding
-        return self.session.post(f"{self.base_url}/v1/updates", json=data).json()
+        data = {
+            k: v
+            for k, v in zip(_UPDATE_HISTORY_V1_FIELDS, (after, page_size, daml_value_encoding))
+            if v is not None
+        }
+        return self._json(self._post_raw(self._url.updates_v1, _dumps(data)))
 
     def get_update_by_id_v1(self, update_id: str, daml_value_encoding: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -218,10 +598,8 @@ class ScanApiClient:
         Input: update_id, daml_value_encoding (optional)
         Output: JSON with update info.
         """
-        params = {}
-        if daml_value_encoding:
-            params["daml_value_encoding"] = daml_value_encoding
-        return self.session.get(f"{self.base_url}/v1/updates/{update_id}", params=params).json()
+        params = {"daml_value_encoding": daml_value_encoding} if daml_value_encoding else {}
+        return self._json(self.session.get(self._tpl_update_by_id_v1.format(update_id), params=params))
 
     def get_acs_snapshot_timestamp(self, before: str, migration_id: int) -> Dict[str, Any]:
         """
@@ -230,7 +608,7 @@ class ScanApiClient:
         Output: JSON with snapshot timestamp.
         """
         params = {"before": before, "migration_id": migration_id}
-        return self.session.get(f"{self.base_url}/v0/state/acs/snapshot-timestamp", params=params).json()
+        return self._json(self.session.get(self._url.acs_snapshot_timestamp, params=params))
 
     def get_acs_snapshot_at(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -238,11 +616,11 @@ class ScanApiClient:
         Input: data: JSON body (migration id, record time, etc.)
         Output: JSON with ACS snapshot.
         """
-        return self.session.post(f"{self.base_url}/v0/state/acs", json=data).json()
+        return self._json(self._post_raw(self._url.acs, _dumps(data)))
 
     def force_acs_snapshot_now(self) -> Dict[str, Any]:
         """POST /v0/state/acs/force - Force ACS snapshot."""
-        return self.session.post(f"{self.base_url}/v0/state/acs/force").json()
+        return self._json(self._post_raw(self._url.acs_force, None))
 
     def get_holdings_state_at(
         self,
@@ -258,15 +636,12 @@ class ScanApiClient:
         Output: JSON with holdings state.
         """
         data: Dict[str, Any] = {"migration_id": migration_id}
-        if record_time is not None:
-            data["record_time"] = record_time
-        if after is not None:
-            data["after"] = after
-        if page_size is not None:
-            data["page_size"] = page_size
-        if owner_party_ids is not None:
-            data["owner_party_ids"] = owner_party_ids
-        return self.session.post(f"{self.base_url}/v0/holdings/state", json=data).json()
+        data.update(
+            (k, v)
+            for k, v in zip(_HOLDINGS_STATE_FIELDS, (record_time, after, page_size, owner_party_ids))
+            if v is not None
+        )
+        return self._json(self._post_raw(self._url.holdings_state, _dumps(data)))
 
     def get_holdings_summary_at_time(
         self,
@@ -281,13 +656,12 @@ class ScanApiClient:
         Output: JSON with holdings summary.
         """
         data: Dict[str, Any] = {"migration_id": migration_id}
-        if record_time is not None:
-            data["record_time"] = record_time
-        if owner_party_ids is not None:
-            data["owner_party_ids"] = owner_party_ids
-        if as_of_round is not None:
-            data["as_of_round"] = as_of_round
-        return self.session.post(f"{self.base_url}/v0/holdings/summary", json=data).json()
+        data.update(
+            (k, v)
+            for k, v in zip(_HOLDINGS_SUMMARY_FIELDS, (record_time, owner_party_ids, as_of_round))
+            if v is not None
+        )
+        return self._json(self._post_raw(self._url.holdings_summary, _dumps(data)))
 
     def get_holdings_summary_at(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -295,7 +669,7 @@ class ScanApiClient:
         Input: data: JSON body (migration id, record time, parties, etc.)
         Output: JSON with holdings summary.
         """
-        return self.session.post(f"{self.base_url}/v0/holdings/summary", json=data).json()
+        return self._json(self._post_raw(self._url.holdings_summary, _dumps(data)))
 
     def list_ans_entries(self, name_prefix: Optional[str] = None, page_size: Optional[int] = None) -> Dict[str, Any]:
         """
@@ -303,12 +677,8 @@ class ScanApiClient:
         Input: name_prefix (optional), page_size (optional)
         Output: JSON with ANS entries.
         """
-        params = {}
-        if name_prefix is not None:
-            params["name_prefix"] = name_prefix
-        if page_size is not None:
-            params["page_size"] = page_size
-        return self.session.get(f"{self.base_url}/v0/ans-entries", params=params).json()
+        params = {k: v for k, v in zip(_ANS_ENTRIES_PARAMS, (name_prefix, page_size)) if v is not None}
+        return self._json(self.session.get(self._url.ans_entries, params=params))
 
     def lookup_ans_entry_by_party(self, party: str) -> Dict[str, Any]:
         """
@@ -316,7 +686,7 @@ class ScanApiClient:
         Input: party (str)
         Output: JSON with ANS entry.
         """
-        return self.session.get(f"{self.base_url}/v0/ans-entries/by-party/{party}").json()
+        return self._json(self.session.get(self._tpl_ans_entry_by_party.format(party)))
 
     def lookup_ans_entry_by_name(self, name: str) -> Dict[str, Any]:
         """
@@ -324,11 +694,11 @@ class ScanApiClient:
         Input: name (str)
         Output: JSON with ANS entry.
         """
-        return self.session.get(f"{self.base_url}/v0/ans-entries/by-name/{name}").json()
+        return self._json(self.session.get(self._tpl_ans_entry_by_name.format(name)))
 
     def get_dso_party_id(self) -> Dict[str, Any]:
         """GET /v0/dso-party-id - Get DSO party ID."""
-        return self.session.get(f"{self.base_url}/v0/dso-party-id").json()
+        return self._json(self.session.get(self._url.dso_party_id))
 
     def get_amulet_rules(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -336,7 +706,7 @@ class ScanApiClient:
         Input: data: JSON body
         Output: JSON with amulet rules.
         """
-        return self.session.post(f"{self.base_url}/v0/amulet-rules", json=data).json()
+        return self._json(self._post_raw(self._url.amulet_rules, _dumps(data)))
 
     def get_external_party_amulet_rules(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -344,7 +714,7 @@ class ScanApiClient:
         Input: data: JSON body
         Output: JSON with external party amulet rules.
         """
-        return self.session.post(f"{self.base_url}/v0/external-party-amulet-rules", json=data).json()
+        return self._json(self._post_raw(self._url.external_party_amulet_rules, _dumps(data)))
 
     def get_ans_rules(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -352,11 +722,11 @@ class ScanApiClient:
         Input: data: JSON body
         Output: JSON with ANS rules.
         """
-        return self.session.post(f"{self.base_url}/v0/ans-rules", json=data).json()
+        return self._json(self._post_raw(self._url.ans_rules, _dumps(data)))
 
     def list_featured_app_rights(self) -> Dict[str, Any]:
         """GET /v0/featured-apps - List featured app rights."""
-        return self.session.get(f"{self.base_url}/v0/featured-apps").json()
+        return self._json(self.session.get(self._url.featured_apps))
 
     def lookup_featured_app_right(self, provider_party_id: str) -> Dict[str, Any]:
         """
@@ -364,7 +734,7 @@ class ScanApiClient:
         Input: provider_party_id (str)
         Output: JSON with featured app right.
         """
-        return self.session.get(f"{self.base_url}/v0/featured-apps/{provider_party_id}").json()
+        return self._json(self.session.get(self._tpl_featured_app_right.format(provider_party_id)))
 
     def get_top_validators_by_validator_faucets(self, limit: int) -> Dict[str, Any]:
         """
@@ -372,7 +742,7 @@ class ScanApiClient:
         Input: limit (int)
         Output: JSON with top validators by faucets.
         """
-        return self.session.get(f"{self.base_url}/v0/top-validators-by-validator-faucets", params={"limit": limit}).json()
+        return self._json(self.session.get(self._url.top_validators_by_validator_faucets, params={"limit": limit}))
 
     def lookup_transfer_preapproval_by_party(self, party: str) -> Dict[str, Any]:
         """
@@ -380,7 +750,7 @@ class ScanApiClient:
         Input: party (str)
         Output: JSON with transfer preapproval.
         """
-        return self.session.get(f"{self.base_url}/v0/transfer-preapprovals/by-party/{party}").json()
+        return self._json(self.session.get(self._tpl_transfer_preapproval_by_party.format(party)))
 
     def lookup_transfer_command_counter_by_party(self, party: str) -> Dict[str, Any]:
         """
@@ -388,7 +758,7 @@ class ScanApiClient:
         Input: party (str)
         Output: JSON with transfer command counter.
         """
-        return self.session.get(f"{self.base_url}/v0/transfer-command-counter/{party}").json()
+        return self._json(self.session.get(self._tpl_transfer_command_counter.format(party)))
 
     def lookup_transfer_command_status(self, sender: str, nonce: str) -> Dict[str, Any]:
         """
@@ -397,11 +767,11 @@ class ScanApiClient:
         Output: JSON with transfer command status.
         """
         params = {"sender": sender, "nonce": nonce}
-        return self.session.get(f"{self.base_url}/v0/transfer-command/status", params=params).json()
+        return self._json(self.session.get(self._url.transfer_command_status, params=params))
 
     def get_migration_schedule(self) -> Dict[str, Any]:
         """GET /v0/migrations/schedule - Get migration schedule."""
-        return self.session.get(f"{self.base_url}/v0/migrations/schedule").json()
+        return self._json(self.session.get(self._url.migration_schedule))
 
     def get_synchronizer_identities(self, domain_id_prefix: str) -> Dict[str, Any]:
         """
@@ -409,7 +779,7 @@ class ScanApiClient:
         Input: domain_id_prefix (str)
         Output: JSON with synchronizer identities.
         """
-        return self.session.get(f"{self.base_url}/v0/synchronizer-identities/{domain_id_prefix}").json()
+        return self._json(self.session.get(self._tpl_synchronizer_identities.format(domain_id_prefix)))
 
     def get_synchronizer_bootstrapping_transactions(self, domain_id_prefix: str) -> Dict[str, Any]:
         """
@@ -417,15 +787,15 @@ class ScanApiClient:
         Input: domain_id_prefix (str)
         Output: JSON with bootstrapping transactions.
         """
-        return self.session.get(f"{self.base_url}/v0/synchronizer-bootstrapping-transactions/{domain_id_prefix}").json()
+        return self._json(self.session.get(self._tpl_synchronizer_bootstrapping.format(domain_id_prefix)))
 
     def get_splice_instance_names(self) -> Dict[str, Any]:
         """GET /v0/splice-instance-names - Get splice instance names."""
-        return self.session.get(f"{self.base_url}/v0/splice-instance-names").json()
+        return self._json(self.session.get(self._url.splice_instance_names))
 
     def list_amulet_price_votes(self) -> Dict[str, Any]:
         """GET /v0/amulet-price/votes - List amulet price votes."""
-        return self.session.get(f"{self.base_url}/v0/amulet-price/votes").json()
+        return self._json(self.session.get(self._url.amulet_price_votes))
 
     def list_vote_requests_by_tracking_cid(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -433,7 +803,7 @@ class ScanApiClient:
         Input: data: JSON body
         Output: JSON with vote requests.
         """
-        return self.session.post(f"{self.base_url}/v0/voterequest", json=data).json()
+        return self._json(self._post_raw(self._url.voterequest, _dumps(data)))
 
     def lookup_dso_rules_vote_request(self, vote_request_contract_id: str) -> Dict[str, Any]:
         """
@@ -441,11 +811,11 @@ class ScanApiClient:
         Input: vote_request_contract_id (str)
         Output: JSON with DSO rules vote request.
         """
-        return self.session.get(f"{self.base_url}/v0/voterequests/{vote_request_contract_id}").json()
+        return self._json(self.session.get(self._tpl_vote_request.format(vote_request_contract_id)))
 
     def list_dso_rules_vote_requests(self) -> Dict[str, Any]:
         """GET /v0/admin/sv/voterequests - List DSO rules vote requests."""
-        return self.session.get(f"{self.base_url}/v0/admin/sv/voterequests").json()
+        return self._json(self.session.get(self._url.admin_voterequests))
 
     def list_vote_request_results(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -453,7 +823,7 @@ class ScanApiClient:
         Input: data: JSON body
         Output: JSON with vote results.
         """
-        return self.session.post(f"{self.base_url}/v0/admin/sv/voteresults", json=data).json()
+        return self._json(self._post_raw(self._url.admin_voteresults, _dumps(data)))
 
     def get_migration_info(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -461,7 +831,7 @@ class ScanApiClient:
         Input: data: JSON body
         Output: JSON with migration info.
         """
-        return self.session.post(f"{self.base_url}/v0/backfilling/migration-info", json=data).json()
+        return self._json(self._post_raw(self._url.migration_info, _dumps(data)))
 
     def get_updates_before(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -469,7 +839,7 @@ class ScanApiClient:
         Input: data: JSON body
         Output: JSON with updates before a given point.
         """
-        return self.session.post(f"{self.base_url}/v0/backfilling/updates-before", json=data).json()
+        return self._json(self._post_raw(self._url.updates_before, _dumps(data)))
 
     # Deprecated endpoints (examples)
     def get_acs_snapshot(self, party: str) -> Dict[str, Any]:
@@ -478,11 +848,11 @@ class ScanApiClient:
         Input: party (str)
         Output: JSON with ACS snapshot.
         """
-        return self.session.get(f"{self.base_url}/v0/acs/{party}").json()
+        return self._json(self.session.get(self._tpl_acs_snapshot.format(party)))
 
     def get_aggregated_rounds(self) -> Dict[str, Any]:
         """GET /v0/aggregated-rounds - Get aggregated rounds."""
-        return self.session.get(f"{self.base_url}/v0/aggregated-rounds").json()
+        return self._json(self.session.get(self._url.aggregated_rounds))
 
     def list_round_totals(self, start_round: int, end_round: int) -> list[RoundTotalEntry]:
         """
@@ -491,8 +861,227 @@ class ScanApiClient:
         Output: List of round totals between start_round and end_round (inclusive).
         """
         data = {"start_round": start_round, "end_round": end_round}
-        response = self.session.post(f"{self.base_url}/v0/round-totals", json=data).json()
-        return response.get("entries", [])
+        response = self._post_json(self._url.round_totals, data)
+        # Return the response's own list; .get(..., []) would allocate a dead
+        # default list on every (frequent) call.
+        entries = response.get("entries")
+        return entries if entries is not None else []
+
+    def _round_totals_batch_uncached(
+        self, start_round: int, end_round: int
+    ) -> Tuple[RoundTotalEntry, ...]:
+        """
+        list_round_totals as a tuple, for the per-instance lru_cache wrapper
+        (self._cached_round_totals_batch).  Closed rounds never change, so
+        repeated batch fetches are pure refetches; callers must not mutate
+        the cached entries.
+        """
+        return tuple(self.list_round_totals(start_round, end_round))
+
+    def _ensure_effective_times(self, lo: int, hi: int) -> Dict[int, str]:
+        """
+        Make sure self._effective_time_cache covers [lo, hi] and return it.
+        Only gap sub-ranges are fetched (in _ROUND_BATCH_SIZE batches), so
+        overlapping months and repeated range queries skip rounds that have
+        already been resolved.
+        """
+        cache = self._effective_time_cache
+        batch_size = self._ROUND_BATCH_SIZE
+        r = lo
+        while r <= hi:
+            if r in cache:
+                r += 1
+                continue
+            gap_start = r
+            while r <= hi and r not in cache:
+                r += 1
+            for batch_start in range(gap_start, r, batch_size):
+                batch_end = min(batch_start + batch_size - 1, r - 1)
+                logger.debug("Fetching round totals for rounds %s to %s", batch_start, batch_end)
+                cache.update(
+                    _round_effective_times(self._cached_round_totals_batch(batch_start, batch_end))
+                )
+        return cache
+
+    def list_round_totals_rows(self, start_round: int, end_round: int) -> List[RoundTotalRow]:
+        """
+        POST /v0/round-totals, returned as slotted RoundTotalRow objects.
+        Same data as list_round_totals at a fraction of the per-row memory;
+        prefer this when holding thousands of rounds in memory at once.
+        """
+        return [
+            RoundTotalRow(*(e.get(f) for f in _ROUND_TOTAL_FIELDS))
+            for e in self.list_round_totals(start_round, end_round)
+        ]
+
+    def list_round_totals_indexed(self, start_round: int, end_round: int) -> Dict[int, Optional[str]]:
+        """
+        POST /v0/round-totals, indexed by round.
+        Input: start_round (int), end_round (int)
+        Output: {closed_round: effective_at} built in one dict-comprehension
+        pass, so lookups for a specific round are O(1) instead of a linear
+        scan over the entries list.
+        """
+        data = {"start_round": start_round, "end_round": end_round}
+        response = self._post_json(self._url.round_totals, data)
+        return {
+            e["closed_round"]: e.get("closed_round_effective_at") or e.get("effectiveAt") or e.get("effective_at")
+            for e in response.get("entries") or []
+            if e.get("closed_round") is not None
+        }
+
+    def _iter_round_totals(self, start_round: int, end_round: int):
+        """
+        Generator variant of list_round_totals. With ijson installed, entries
+        are parsed incrementally off the wire so consumers can stop early and
+        peak memory stays at one entry instead of the whole response; without
+        it, this falls back to the eager fetch and just yields from it.
+        """
+        # The incremental path needs requests' raw file-like response; on the
+        # httpx transport (or without ijson) fall back to the eager fetch.
+        if ijson is None or not isinstance(self.session, requests.Session):
+            yield from self.list_round_totals(start_round, end_round)
+            return
+        data = {"start_round": start_round, "end_round": end_round}
+        response = self.session.post(
+            self._url.round_totals, data=_dumps(data), headers=_JSON_HEADERS, stream=True
+        )
+        try:
+            # requests leaves the urllib3 stream compressed by default
+            # (decode_content=False); tell it to decompress as we read, or
+            # ijson would be fed raw gzip/brotli bytes.
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, "entries.item")
+        finally:
+            # Release the socket back to the pool even on early exit.
+            response.close()
+
+    def _fetch_round_batch_uncached(self, batch_start: int, batch_end: int) -> Tuple[Optional[Tuple[str, int, int]], ...]:
+        """
+        Fetch one aligned round-totals batch and pre-parse it into a tuple
+        indexed by (round_num - batch_start). Each slot is (effective_at_str,
+        year, month) or None for rounds without data. The ISO8601 prefix is
+        fixed-width, so year/month come from string slices once per batch
+        instead of a full datetime parse per binary-search probe.
+        """
+        cached = self._disk_cache_get(batch_start, batch_end)
+        if cached is not None:
+            rows: List[Optional[Tuple[str, int, int]]] = [tuple(r) if r is not None else None for r in cached]
+        else:
+            rows = [None] * (batch_end - batch_start + 1)
+            # The source is a generator, so detect the effective-at spelling
+            # on the first entry that carries one rather than pre-scanning.
+            eff_key: Optional[str] = None
+            for entry in self._iter_round_totals(batch_start, batch_end):
+                round_num = entry.get("closed_round")
+                if eff_key is None:
+                    eff_key = _effective_at_key((entry,))
+                effective_at = entry.get(eff_key) if eff_key else None
+                if round_num is None or not effective_at or not (batch_start <= round_num <= batch_end):
+                    continue
+                try:
+                    year, month = int(effective_at[0:4]), int(effective_at[5:7])
+                except ValueError:
+                    continue
+                rows[round_num - batch_start] = (effective_at, year, month)
+            self._disk_cache_put(batch_start, batch_end, rows)
+        self._fetched_batches.add(batch_start)
+        present = [(batch_start + i, row[1], row[2]) for i, row in enumerate(rows) if row is not None]
+        self._ym_by_batch[batch_start] = tuple(zip(*present)) if present else ((), (), ())
+        return tuple(rows)
+
+    def _disk_cache(self) -> Optional[sqlite3.Connection]:
+        if self._disk_cache_path is None:
+            return None
+        if self._disk_conn is None:
+            try:
+                conn = sqlite3.connect(self._disk_cache_path, check_same_thread=False)
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS round_batches ("
+                    "base_url TEXT, batch_start INTEGER, batch_end INTEGER, rows BLOB, "
+                    "PRIMARY KEY (base_url, batch_start, batch_end))"
+                )
+                self._disk_conn = conn
+            except sqlite3.Error:
+                self._disk_cache_path = None
+                return None
+        return self._disk_conn
+
+    def _disk_cache_get(self, batch_start: int, batch_end: int) -> Optional[list]:
+        conn = self._disk_cache()
+        if conn is None:
+            return None
+        with self._disk_lock:
+            row = conn.execute(
+                "SELECT rows FROM round_batches WHERE base_url = ? AND batch_start = ? AND batch_end = ?",
+                (self.base_url, batch_start, batch_end),
+            ).fetchone()
+        return _loads(row[0]) if row else None
+
+    def _disk_cache_put(self, batch_start: int, batch_end: int, rows: list) -> None:
+        # Only persist batches that lie fully in the past: those rounds are
+        # closed and their effective times can never change. A batch near the
+        # latest round may still be partially filled, so it stays memory-only.
+        conn = self._disk_cache()
+        latest = self._latest_round_seen
+        if conn is None or latest is None or batch_end >= latest - self._ROUND_BATCH_SIZE:
+            return
+        with self._disk_lock:
+            conn.execute(
+                "INSERT OR REPLACE INTO round_batches (base_url, batch_start, batch_end, rows) VALUES (?, ?, ?, ?)",
+                (self.base_url, batch_start, batch_end, _dumps(rows)),
+            )
+            conn.commit()
+
+    def _cached_month_bounds(self, year: int, month: int) -> Optional[Tuple[int, int]]:
+        """
+        Try to resolve the month boundaries purely from already-fetched
+        batches. Scans each contiguous run of cached batches with
+        _scan_month_bounds and only trusts a hit when the run also covers
+        rounds strictly before and after the month, so a partially covered
+        month still falls through to the binary search.
+        """
+        if not self._ym_by_batch:
+            return None
+        batch_size = self._ROUND_BATCH_SIZE
+        starts = sorted(self._ym_by_batch)
+        run: List[int] = []
+        for i, start in enumerate(starts):
+            run.append(start)
+            is_last = i + 1 == len(starts)
+            if not is_last and starts[i + 1] == start + batch_size:
+                continue
+            rounds: List[int] = []
+            years: List[int] = []
+            months: List[int] = []
+            for s in run:
+                br, by, bm = self._ym_by_batch[s]
+                rounds.extend(br)
+                years.extend(by)
+                months.extend(bm)
+            run = []
+            if not rounds:
+                continue
+            if np is not None:
+                arr_r, arr_y, arr_m = (np.asarray(a, dtype=np.int64) for a in (rounds, years, months))
+            else:
+                arr_r, arr_y, arr_m = rounds, years, months
+            first, last = _scan_month_bounds(arr_r, arr_y, arr_m, year, month)
+            if first < 0:
+                continue
+            # Trust the scan only when the run brackets the month on both sides.
+            if (years[0], months[0]) < (year, month) and (years[-1], months[-1]) > (year, month):
+                return int(first), int(last)
+        return None
+
+    def _get_round_row(self, round_num: int, latest_round: int) -> Optional[Tuple[str, int, int]]:
+        """Look up one round's (effective_at, year, month) via the memoized batch cache."""
+        batch_size = self._ROUND_BATCH_SIZE
+        batch_start = (round_num // batch_size) * batch_size
+        batch_end = min(batch_start + batch_size - 1, latest_round)
+        if round_num > batch_end:
+            return None
+        return self._fetch_round_batch(batch_start, batch_end)[round_num - batch_start]
 
     def list_round_party_totals(
         self,
@@ -515,7 +1104,7 @@ class ScanApiClient:
             "start_round": start_round,
             "end_round": end_round,
         }
-        return self.session.post(f"{self.base_url}/v0/round-party-totals", json=data).json()
+        return self._json(self._post_raw(self._url.round_party_totals, _dumps(data)))
 
     def get_total_amulet_balance(self, as_of_end_of_round: int) -> Dict[str, Any]:
         """
@@ -523,7 +1112,7 @@ class ScanApiClient:
         Input: as_of_end_of_round (int)
         Output: JSON with total amulet balance.
         """
-        return self.session.get(f"{self.base_url}/v0/total-amulet-balance", params={"asOfEndOfRound": as_of_end_of_round}).json()
+        return self._json(self.session.get(self._url.total_amulet_balance, params={"asOfEndOfRound": as_of_end_of_round}))
 
     def get_wallet_balance(self, party_id: str, as_of_end_of_round: int) -> WalletBalanceResponse:
         """
@@ -532,7 +1121,87 @@ class ScanApiClient:
         Output: JSON with wallet balance.
         """
         params = {"party_id": party_id, "asOfEndOfRound": as_of_end_of_round}
-        return self.session.get(f"{self.base_url}/v0/wallet-balance", params=params).json()
+        return self._get_json(self._url.wallet_balance, params=params)
+
+    def _get_wallet_balance_with_retry(
+        self, party_id: str, as_of_end_of_round: int, attempts: int = 3
+    ) -> WalletBalanceResponse:
+        """
+        get_wallet_balance with a short retry/backoff loop, for use from
+        thread-pool fan-outs where a single transient failure would otherwise
+        abort the whole batch.
+        """
+        for attempt in range(attempts):
+            try:
+                return self.get_wallet_balance(party_id, as_of_end_of_round)
+            except _TRANSPORT_ERRORS:
+                if attempt == attempts - 1:
+                    raise
+                time.sleep(0.2 * (2 ** attempt))
+        raise RuntimeError("unreachable")
+
+    def _batch_get_wallet_balance(
+        self,
+        party_id: str,
+        rounds: List[int],
+        batch_size: int = 100,
+        max_workers: int = 16,
+    ) -> Dict[int, WalletBalanceResponse]:
+        """
+        Fetch wallet balances for many rounds at once, returning {round: response}.
+
+        The scan REST API has no JSON-RPC batch endpoint, so the coalescing
+        happens client-side: rounds are processed in chunks of batch_size and
+        the lookups within each chunk are issued concurrently over the pooled
+        keep-alive connections, amortizing round-trip latency the way a
+        server-side batch would without changing the wire protocol.
+        """
+        results: Dict[int, WalletBalanceResponse] = {}
+        for i in range(0, len(rounds), batch_size):
+            chunk = rounds[i : i + batch_size]
+            with ThreadPoolExecutor(max_workers=min(max_workers, max(1, len(chunk)))) as ex:
+                fetched = ex.map(
+                    lambda r: self._get_wallet_balance_with_retry(party_id, r), chunk
+                )
+                for r, resp in zip(chunk, fetched):
+                    results[r] = resp
+        return results
+
+    def _wallet_balance_rows(
+        self,
+        party_id: str,
+        rounds: range,
+        round_to_effective_time: Dict[int, str],
+        use_batch: bool,
+        max_workers: int,
+    ) -> List[tuple]:
+        """
+        Resolve (round, effective_time, wallet_balance) tuples for a range of
+        rounds, either through _batch_get_wallet_balance (default) or, with
+        use_batch=False, via a plain per-round thread-pool fan-out.
+        """
+        if use_batch:
+            balances = self._batch_get_wallet_balance(
+                party_id, list(rounds), max_workers=max_workers
+            )
+            return [
+                (
+                    r,
+                    round_to_effective_time.get(r),
+                    balances.get(r, {}).get("wallet_balance"),
+                )
+                for r in rounds
+            ]
+
+        def _fetch_one(r: int) -> tuple:
+            return (
+                r,
+                round_to_effective_time.get(r),
+                self._get_wallet_balance_with_retry(party_id, r).get("wallet_balance"),
+            )
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, max(1, len(rounds)))) as ex:
+            return list(ex.map(_fetch_one, rounds))
 
     def get_latest_wallet_balance(self, party_id: str) -> LatestWalletBalanceResponse:
         """
@@ -552,17 +1221,14 @@ class ScanApiClient:
         
         if latest_round is None:
             raise ValueError("Could not determine latest round")
-            
-        # Get the wallet balance for the latest round
+
+        # Get the wallet balance for the latest round and annotate the
+        # response in place rather than rebuilding a fresh dict.
         balance_data = self.get_wallet_balance(party_id, latest_round)
-        wallet_balance = balance_data.get("wallet_balance")
-        
-        return {
-            "round": latest_round,
-            "effective_at": effective_at,
-            "wallet_balance": wallet_balance,
-            "party_id": party_id
-        }
+        balance_data["round"] = latest_round
+        balance_data["effective_at"] = effective_at
+        balance_data["party_id"] = party_id
+        return balance_data
 
     def get_amulet_config_for_round(self, round_num: int) -> Dict[str, Any]:
         """
@@ -570,11 +1236,39 @@ class ScanApiClient:
         Input: round_num (int)
         Output: JSON with amulet config.
         """
-        return self.session.get(f"{self.base_url}/v0/amulet-config-for-round", params={"round": round_num}).json()
+        return self._json(self.session.get(self._url.amulet_config_for_round, params={"round": round_num}))
 
     def get_round_of_latest_data(self) -> RoundOfLatestDataResponse:
-        """GET /v0/round-of-latest-data - Get round of latest data."""
-        return self.session.get(f"{self.base_url}/v0/round-of-latest-data").json()
+        """GET /v0/round-of-latest-data - Get round of latest data (TTL-cached)."""
+        cached = self._latest_round_cache
+        if cached is not None and time.monotonic() - cached[0] < self._latest_round_ttl:
+            return cached[1]
+        response = self._get_json(self._url.round_of_latest_data)
+        latest_round = response.get("round")
+        if latest_round is not None:
+            # Remembered so the disk cache knows which batches are immutable.
+            self._latest_round_seen = latest_round
+            self._latest_round_cache = (time.monotonic(), response)
+        return response
+
+    def refresh_latest_round(self) -> RoundOfLatestDataResponse:
+        """Drop the TTL cache and re-query the round of latest data."""
+        self._latest_round_cache = None
+        return self.get_round_of_latest_data()
+
+    def clear_caches(self) -> None:
+        """
+        Drop all in-memory memoization (round batches, round-totals batches,
+        ACS snapshot timestamps, latest-round TTL cache).  Useful in
+        long-running sessions; the on-disk round-batch cache is unaffected.
+        """
+        self._fetch_round_batch.cache_clear()
+        self._cached_round_totals_batch.cache_clear()
+        self._cached_acs_snapshot.cache_clear()
+        self._fetched_batches.clear()
+        self._ym_by_batch.clear()
+        self._effective_time_cache.clear()
+        self._latest_round_cache = None
 
     def get_rewards_collected(self, round_num: Optional[int] = None) -> Dict[str, Any]:
         """
@@ -585,7 +1279,7 @@ class ScanApiClient:
         params = {}
         if round_num is not None:
             params["round"] = round_num
-        return self.session.get(f"{self.base_url}/v0/rewards-collected", params=params).json()
+        return self._json(self.session.get(self._url.rewards_collected, params=params))
 
     def get_top_providers_by_app_rewards(self, round_num: int, limit: int) -> Dict[str, Any]:
         """
@@ -594,7 +1288,7 @@ class ScanApiClient:
         Output: JSON with top providers by app rewards.
         """
         params = {"round": round_num, "limit": limit}
-        return self.session.get(f"{self.base_url}/v0/top-providers-by-app-rewards", params=params).json()
+        return self._json(self.session.get(self._url.top_providers_by_app_rewards, params=params))
 
     def get_top_validators_by_validator_rewards(self, round_num: int, limit: int) -> Dict[str, Any]:
         """
@@ -603,7 +1297,7 @@ class ScanApiClient:
         Output: JSON with top validators by validator rewards.
         """
         params = {"round": round_num, "limit": limit}
-        return self.session.get(f"{self.base_url}/v0/top-validators-by-validator-rewards", params=params).json()
+        return self._json(self.session.get(self._url.top_validators_by_validator_rewards, params=params))
 
     def get_top_validators_by_purchased_traffic(self, round_num: int, limit: int) -> Dict[str, Any]:
         """
@@ -612,7 +1306,7 @@ class ScanApiClient:
         Output: JSON with top validators by purchased traffic.
         """
         params = {"round": round_num, "limit": limit}
-        return self.session.get(f"{self.base_url}/v0/top-validators-by-purchased-traffic", params=params).json()
+        return self._json(self.session.get(self._url.top_validators_by_purchased_traffic, params=params))
 
     def list_activity(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -620,7 +1314,7 @@ class ScanApiClient:
         Input: data: JSON body
         Output: JSON with activities.
         """
-        return self.session.post(f"{self.base_url}/v0/activities", json=data).json()
+        return self._post_json(self._url.activities, data)
 
     def list_transaction_history(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -628,7 +1322,7 @@ class ScanApiClient:
         Input: data: JSON body
         Output: JSON with transaction history.
         """
-        return self.session.post(f"{self.base_url}/v0/transactions", json=data).json()
+        return self._post_json(self._url.transactions, data)
 
     def get_update_history(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -636,7 +1330,7 @@ class ScanApiClient:
         Input: data: JSON body
         Output: JSON with update history.
         """
-        return self.session.post(f"{self.base_url}/v0/updates", json=data).json()
+        return self._post_json(self._url.updates, data)
 
     def get_update_by_id(self, update_id: str, lossless: Optional[bool] = None) -> Dict[str, Any]:
         """
@@ -647,11 +1341,11 @@ class ScanApiClient:
         params = {}
         if lossless is not None:
             params["lossless"] = lossless
-        return self.session.get(f"{self.base_url}/v0/updates/{update_id}", params=params).json()
+        return self._json(self.session.get(self._tpl_update_by_id.format(update_id), params=params))
 
     def feature_support(self) -> Dict[str, Any]:
         """GET /v0/feature-support - Get feature support info."""
-        return self.session.get(f"{self.base_url}/v0/feature-support").json()
+        return self._json(self.session.get(self._url.feature_support))
 
     def find_rounds_for_month(self, year: int, month: int) -> Optional[FindRoundsForMonthResult]:
         """
@@ -663,77 +1357,141 @@ class ScanApiClient:
         if latest_round is None:
             return None
 
-        batch_size = 200
+        batch_size = self._ROUND_BATCH_SIZE
 
         def get_effective_at(round_num: int) -> Optional[str]:
+            row = self._get_round_row(round_num, latest_round)
+            return row[0] if row else None
+
+        target_ym = (year, month)
+
+        # Fast path: repeat queries over months already covered by cached
+        # batches resolve with one in-memory scan and zero HTTP calls.
+        cached_bounds = self._cached_month_bounds(year, month)
+        if cached_bounds is not None:
+            first_in_month, last_in_month = cached_bounds
+            return {
+                "start_round": first_in_month,
+                "start_time": get_effective_at(first_in_month),
+                "end_round": last_in_month,
+                "end_time": get_effective_at(last_in_month),
+            }
+
+        def probe(executor: ThreadPoolExecutor, mid: int, lo: int, hi: int) -> List[Tuple[int, Optional[Tuple[str, int, int]]]]:
+            # Speculatively probe mid and its batch neighbours in parallel so a
+            # single round-trip's worth of latency yields three comparison points.
+            points = [mid]
+            if mid - batch_size >= lo:
+                points.append(mid - batch_size)
+            if mid + batch_size <= hi:
+                points.append(mid + batch_size)
+            futures = {p: executor.submit(self._get_round_row, p, latest_round) for p in points}
+            return [(p, futures[p].result()) for p in sorted(futures)]
+
+        def search_first(executor: ThreadPoolExecutor) -> Optional[Tuple[int, str]]:
+            # Binary search for the first round in the month. Matches carry
+            # their effective-time string so no follow-up lookup is needed.
+            left, right = 0, latest_round
+            first_in_month = None
+            while left <= right:
+                mid = (left + right) // 2
+                for p, row in probe(executor, mid, left, right):
+                    if row is None:
+                        if p == mid:
+                            left = max(left, mid + 1)
+                        continue
+                    ym = (row[1], row[2])
+                    if ym < target_ym:
+                        left = max(left, p + 1)
+                    elif ym > target_ym:
+                        right = min(right, p - 1)
+                    else:
+                        if first_in_month is None or p < first_in_month[0]:
+                            first_in_month = (p, row[0])
+                        right = min(right, p - 1)  # search for earlier in month
+            return first_in_month
+
+        def search_last(executor: ThreadPoolExecutor, lo: int) -> Optional[Tuple[int, str]]:
+            # Binary search for the last round in the month over [lo, latest]
+            left, right = lo, latest_round
+            last_in_month = None
+            while left <= right:
+                mid = (left + right) // 2
+                for p, row in probe(executor, mid, left, right):
+                    if row is None:
+                        if p == mid:
+                            left = max(left, mid + 1)
+                        continue
+                    ym = (row[1], row[2])
+                    if ym > target_ym:
+                        right = min(right, p - 1)
+                    elif ym < target_ym:
+                        left = max(left, p + 1)
+                    else:
+                        if last_in_month is None or p > last_in_month[0]:
+                            last_in_month = (p, row[0])
+                        left = max(left, p + 1)  # search for later in month
+            return last_in_month
+
+        def batch_bounds(round_num: int) -> Tuple[int, int]:
             batch_start = (round_num // batch_size) * batch_size
-            batch_end = min(batch_start + batch_size - 1, latest_round)
-            entries = self.list_round_totals(batch_start, batch_end)
-            for entry in entries:
-                effective_at = (
-                    entry.get("closed_round_effective_at")
-                    or entry.get("effectiveAt")
-                    or entry.get("effective_at")
-                )
-                if entry.get("closed_round") == round_num and effective_at:
-                    return effective_at
-            return None
-
-        def get_effective_at_dt(round_num: int) -> Optional[datetime]:
-            effective_at = get_effective_at(round_num)
-            if effective_at:
-                try:
-                    return datetime.fromisoformat(effective_at.replace("Z", "+00:00"))
-                except Exception:
-                    return None
-            return None
-
-        # Binary search for the first round in the month
-        left, right = 0, latest_round
-        first_in_month = None
-        while left <= right:
-            mid = (left + right) // 2
-            dt = get_effective_at_dt(mid)
-            if dt is None:
-                left = mid + 1
-                continue
-            if (dt.year, dt.month) < (year, month):
-                left = mid + 1
-            elif (dt.year, dt.month) > (year, month):
-                right = mid - 1
-            else:
-                first_in_month = mid
-                right = mid - 1  # search for earlier in month
-
-        if first_in_month is None:
-            return None
-
-        # Binary search for the last round in the month
-        left, right = first_in_month, latest_round
-        last_in_month = first_in_month
-        while left <= right:
-            mid = (left + right) // 2
-            dt = get_effective_at_dt(mid)
-            if dt is None:
-                left = mid + 1
-                continue
-            if (dt.year, dt.month) > (year, month):
-                right = mid - 1
-            elif (dt.year, dt.month) < (year, month):
-                left = mid + 1
-            else:
-                last_in_month = mid
-                left = mid + 1  # search for later in month
-
-        # Get the effective times for the found rounds
-        start_time = get_effective_at(first_in_month)
-        end_time = get_effective_at(last_in_month)
+            return batch_start, min(batch_start + batch_size - 1, latest_round)
+
+        def extend_forward(start: Tuple[int, str]) -> Tuple[Tuple[int, str], bool]:
+            # Linearly extend within start's (already cached) batch; if the
+            # month continues past the batch end the caller resumes searching.
+            batch_start, batch_end = batch_bounds(start[0])
+            rows = self._fetch_round_batch(batch_start, batch_end)
+            last = start
+            for r in range(start[0] + 1, batch_end + 1):
+                row = rows[r - batch_start]
+                if row is None:
+                    continue
+                if (row[1], row[2]) == target_ym:
+                    last = (r, row[0])
+                else:
+                    return last, True
+            return last, batch_end >= latest_round
+
+        def extend_backward(first: Tuple[int, str]) -> Tuple[int, str]:
+            # Validate first_in_month against already-cached predecessors only;
+            # never fetch a new batch just to re-check the binary search.
+            prev = first[0] - 1
+            while prev >= 0:
+                if batch_bounds(prev)[0] not in self._fetched_batches:
+                    break
+                row = self._get_round_row(prev, latest_round)
+                if row is None:
+                    # Effective times are monotonic, so a gap bracketed by
+                    # in-month rounds cannot end the month; keep scanning
+                    # past it like extend_forward does.
+                    prev -= 1
+                    continue
+                if (row[1], row[2]) != target_ym:
+                    break
+                first = (prev, row[0])
+                prev -= 1
+            return first
+
+        with ThreadPoolExecutor(max_workers=4) as probe_pool:
+            first_in_month = search_first(probe_pool)
+            if first_in_month is None:
+                return None
+            first_in_month = extend_backward(first_in_month)
+            # The first-in-month probe already cached this batch, so the last
+            # boundary is usually one linear scan away; only fall back to a
+            # binary search when the month spills past the batch end.
+            last_in_month, bounded = extend_forward(first_in_month)
+            if not bounded:
+                tail = search_last(probe_pool, batch_bounds(last_in_month[0])[1] + 1)
+                if tail is not None:
+                    last_in_month = tail
 
         return {
-            "start_round": first_in_month,
-            "start_time": start_time,
-            "end_round": last_in_month,
-            "end_time": end_time,
+            "start_round": first_in_month[0],
+            "start_time": first_in_month[1],
+            "end_round": last_in_month[0],
+            "end_time": last_in_month[1],
         }
 
     def get_wallet_balances_for_month_from_rounds_estimate(
@@ -753,37 +1511,51 @@ class ScanApiClient:
         start_time = rounds["start_time"]
         end_time = rounds["end_time"]
 
-        for party_id in party_ids:
-            begin_balance = self.get_wallet_balance(party_id, start_round).get("wallet_balance")
-            end_balance = self.get_wallet_balance(party_id, end_round).get("wallet_balance")
+        # The per-party lookups are independent I/O; fan them out over the
+        # pooled session instead of paying 2 round-trips per party serially.
+        # ex.map preserves the input order of party_ids.
+        with ThreadPoolExecutor(max_workers=min(32, max(1, len(party_ids)))) as ex:
+            begin_balances = list(ex.map(lambda p: self.get_wallet_balance(p, start_round), party_ids))
+            end_balances = list(ex.map(lambda p: self.get_wallet_balance(p, end_round), party_ids))
+
+        for party_id, begin_resp, end_resp in zip(party_ids, begin_balances, end_balances):
             result.append({
                 "party_id": party_id,
                 "beginning_of_month_round": start_round,
                 "beginning_of_month_time": start_time,
-                "beginning_of_month_balance": begin_balance,
+                "beginning_of_month_balance": begin_resp.get("wallet_balance"),
                 "end_of_month_round": end_round,
                 "end_of_month_time": end_time,
-                "end_of_month_balance": end_balance,
+                "end_of_month_balance": end_resp.get("wallet_balance"),
             })
 
         if csv_path:
-            fieldnames = [
-                "party_id",
-                "beginning_of_month_round",
-                "beginning_of_month_time",
-                "beginning_of_month_balance",
-                "end_of_month_round",
-                "end_of_month_time",
-                "end_of_month_balance",
-            ]
-            with open(csv_path, "w", newline="") as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                for row in result:
-                    writer.writerow(row)
+            # One buffered writerows call instead of per-row DictWriter
+            # dispatch; the column order is the TypedDict declaration order.
+            fieldnames = list(WalletBalanceForMonth.__annotations__.keys())
+            with open(csv_path, "w", newline="", buffering=1 << 20) as f:
+                writer = csv.writer(f)
+                writer.writerow(fieldnames)
+                writer.writerows([[row[key] for key in fieldnames] for row in result])
 
         return result
 
+    def get_wallet_balances_for_month_from_rounds_estimate_rows(
+        self, party_ids: list[str], year: int, month: int
+    ) -> list[WalletBalanceForMonthRow]:
+        """
+        Same balances as get_wallet_balances_for_month_from_rounds_estimate,
+        returned as slotted WalletBalanceForMonthRow objects.
+        Prefer this when sweeping thousands of parties and holding the
+        results in memory at once.
+        """
+        return [
+            WalletBalanceForMonthRow(**row)
+            for row in self.get_wallet_balances_for_month_from_rounds_estimate(
+                party_ids, year, month
+            )
+        ]
+
     def get_wallet_balances_for_all_rounds_in_month(
         self,
         party_id: str,
@@ -791,46 +1563,38 @@ class ScanApiClient:
         month: int,
         csv: bool = False,
         step: int = 1,
+        max_workers: int = 16,
+        use_batch: bool = True,
     ) -> list[dict]:
         """
         For a given party_id and (year, month), return a list of dicts with wallet balances for every round in that month.
         Each dict contains: round, effective_time, wallet_balance.
         If csv=True, also writes the results to a CSV file named 'wallet_balances_{party_id_short}_{year}_{month:02d}.csv'.
         If step > 1, only include every 'step' rounds.
+        Balance lookups are issued in parallel on a thread pool of max_workers.
         """
-        import sys
-        print(f"[INFO] Finding rounds for {year}-{month:02d}...", file=sys.stderr)
+        logger.info("Finding rounds for %s-%02d...", year, month)
         rounds_info = self.find_rounds_for_month(year, month)
         if not rounds_info:
-            print(f"[WARN] No rounds found for {year}-{month:02d}", file=sys.stderr)
+            logger.warning("No rounds found for %s-%02d", year, month)
             return []
         start_round = rounds_info["start_round"]
         end_round = rounds_info["end_round"]
-        print(f"[DEBUG] start_round={start_round}, end_round={end_round}", file=sys.stderr)
+        logger.debug("start_round=%s, end_round=%s", start_round, end_round)
 
         # Get effective times for all rounds in the month
-        round_to_effective_time = {}
-        batch_size = 200
-        for batch_start in range(start_round, end_round + 1, batch_size):
-            batch_end = min(batch_start + batch_size - 1, end_round)
-            print(f"[DEBUG] Fetching round totals for rounds {batch_start} to {batch_end}", file=sys.stderr)
-            for entry in self.list_round_totals(batch_start, batch_end):
-                round_num = entry.get("closed_round")
-                eff_time = (
-                    entry.get("closed_round_effective_at")
-                    or entry.get("effectiveAt")
-                    or entry.get("effective_at")
-                )
-                if round_num is not None and eff_time:
-                    round_to_effective_time[round_num] = eff_time
+        round_to_effective_time = self._ensure_effective_times(start_round, end_round)
+
+        logger.info("Fetching wallet balances for party_id=%s every %s rounds", party_id, step)
+
+        rounds = range(start_round, end_round + 1, step)
+        rows = self._wallet_balance_rows(
+            party_id, rounds, round_to_effective_time, use_batch, max_workers
+        )
 
         results = []
-        print(f"[INFO] Fetching wallet balances for party_id={party_id} every {step} rounds", file=sys.stderr)
-        for r in range(start_round, end_round + 1, step):
-            eff_time = round_to_effective_time.get(r)
-            balance_resp = self.get_wallet_balance(party_id, r)
-            wallet_balance = balance_resp.get("wallet_balance")
-            print(f"[DEBUG] round={r}, effective_time={eff_time}, wallet_balance={wallet_balance}", file=sys.stderr)
+        for r, eff_time, wallet_balance in rows:
+            logger.debug("round=%s, effective_time=%s, wallet_balance=%s", r, eff_time, wallet_balance)
             results.append({
                 "round": r,
                 "effective_time": eff_time,
@@ -838,17 +1602,18 @@ class ScanApiClient:
             })
 
         if csv:
-            import csv as _csv
             party_short = party_id.split("::")[0]
             filename = f"wallet_balances_{party_short}_{year}_{month:02d}.csv"
-            print(f"[INFO] Writing results to {filename}", file=sys.stderr)
-            with open(filename, "w", newline="") as f:
-                writer = _csv.DictWriter(f, fieldnames=["round", "effective_time", "wallet_balance"])
-                writer.writeheader()
-                for row in results:
-                    writer.writerow(row)
-
-        print(f"[INFO] Done get_wallet_balances_for_all_rounds_in_month for {year}-{month:02d}", file=sys.stderr)
+            logger.info("Writing results to %s", filename)
+            with open(filename, "w", newline="", buffering=1 << 20) as f:
+                writer = _csv.writer(f)
+                writer.writerow(["round", "effective_time", "wallet_balance"])
+                # rows is already columnar-ordered (round, effective_time,
+                # wallet_balance) tuples; write it directly rather than going
+                # back through the result dicts.
+                writer.writerows(rows)
+
+        logger.info("Done get_wallet_balances_for_all_rounds_in_month for %s-%02d", year, month)
         return results
 
     def get_wallet_balances_for_rounds(
@@ -858,38 +1623,29 @@ class ScanApiClient:
         last_round: int,
         step: int = 1,
         csv: bool = False,
+        max_workers: int = 16,
+        use_batch: bool = True,
     ) -> list[dict]:
         """
         For a given party_id and a range of rounds, return a list of dicts with wallet balances for each round in [first_round, last_round] (inclusive).
         Each dict contains: round, effective_time, wallet_balance.
         If step > 1, only include every 'step' rounds.
         If csv=True, writes the results to a CSV file named 'wallet_balances_{party_id_short}_{first_round}_{last_round}.csv'.
+        Balance lookups are issued in parallel on a thread pool of max_workers.
         """
-        import sys
-        print(f"[INFO] Fetching wallet balances for party_id={party_id} from round {first_round} to {last_round} every {step} rounds", file=sys.stderr)
+        logger.info("Fetching wallet balances for party_id=%s from round %s to %s every %s rounds", party_id, first_round, last_round, step)
 
         # Get effective times for all rounds in the range
-        round_to_effective_time = {}
-        batch_size = 200
-        for batch_start in range(first_round, last_round + 1, batch_size):
-            batch_end = min(batch_start + batch_size - 1, last_round)
-            print(f"[DEBUG] Fetching round totals for rounds {batch_start} to {batch_end}", file=sys.stderr)
-            for entry in self.list_round_totals(batch_start, batch_end):
-                round_num = entry.get("closed_round")
-                eff_time = (
-                    entry.get("closed_round_effective_at")
-                    or entry.get("effectiveAt")
-                    or entry.get("effective_at")
-                )
-                if round_num is not None and eff_time:
-                    round_to_effective_time[round_num] = eff_time
+        round_to_effective_time = self._ensure_effective_times(first_round, last_round)
+
+        rounds = range(first_round, last_round + 1, step)
+        rows = self._wallet_balance_rows(
+            party_id, rounds, round_to_effective_time, use_batch, max_workers
+        )
 
         results = []
-        for r in range(first_round, last_round + 1, step):
-            eff_time = round_to_effective_time.get(r)
-            balance_resp = self.get_wallet_balance(party_id, r)
-            wallet_balance = balance_resp.get("wallet_balance")
-            print(f"[DEBUG] round={r}, effective_time={eff_time}, wallet_balance={wallet_balance}", file=sys.stderr)
+        for r, eff_time, wallet_balance in rows:
+            logger.debug("round=%s, effective_time=%s, wallet_balance=%s", r, eff_time, wallet_balance)
             results.append({
                 "round": r,
                 "effective_time": eff_time,
@@ -897,17 +1653,18 @@ class ScanApiClient:
             })
 
         if csv:
-            import csv as _csv
             party_short = party_id.split("::")[0]
             filename = f"wallet_balances_{party_short}_{first_round}_{last_round}.csv"
-            print(f"[INFO] Writing results to {filename}", file=sys.stderr)
-            with open(filename, "w", newline="") as f:
-                writer = _csv.DictWriter(f, fieldnames=["round", "effective_time", "wallet_balance"])
-                writer.writeheader()
-                for row in results:
-                    writer.writerow(row)
-
-        print(f"[INFO] Done get_wallet_balances_for_rounds for {party_id} from {first_round} to {last_round}", file=sys.stderr)
+            logger.info("Writing results to %s", filename)
+            with open(filename, "w", newline="", buffering=1 << 20) as f:
+                writer = _csv.writer(f)
+                writer.writerow(["round", "effective_time", "wallet_balance"])
+                # rows is already columnar-ordered (round, effective_time,
+                # wallet_balance) tuples; write it directly rather than going
+                # back through the result dicts.
+                writer.writerows(rows)
+
+        logger.info("Done get_wallet_balances_for_rounds for %s from %s to %s", party_id, first_round, last_round)
         return results
 
     def get_holdings_summary_for_month(
@@ -923,38 +1680,40 @@ class ScanApiClient:
         If csv_path is provided, write the results to a CSV file (without time columns).
         Returns a list of HoldingsSummaryForMonth dicts.
         """
-        import sys
 
         # Helper to process a single month
         def process_month(year: int, month: int) -> list[HoldingsSummaryForMonth]:
-            print(f"[INFO] Processing holdings summary for {year}-{month:02d}...", file=sys.stderr)
+            logger.info("Processing holdings summary for %s-%02d...", year, month)
             # Format beginning of month timestamp
             begin_time = f"{year:04d}-{month:02d}-01T00:00:00.000000Z"
 
             # Format end of month timestamp (use 23:59:00 for the last day)
-            from calendar import monthrange
             last_day = monthrange(year, month)[1]
             end_time_query = f"{year:04d}-{month:02d}-{last_day:02d}T23:59:59.000000Z"
 
-            # Get the actual record_time for the beginning and end of month
-            print(f"[DEBUG] Getting ACS snapshot timestamp for begin_time_query={begin_time} migration_id={migration_id}", file=sys.stderr)
-            acs_snapshot_begin = self.get_acs_snapshot_timestamp(begin_time, migration_id)
+            # Get the actual record_time for the beginning and end of month;
+            # the two snapshot lookups are independent, so issue them together.
+            logger.debug("Getting ACS snapshot timestamps for begin_time_query=%s end_time_query=%s migration_id=%s", begin_time, end_time_query, migration_id)
+            with ThreadPoolExecutor(max_workers=2) as ex:
+                begin_future = ex.submit(self._cached_acs_snapshot, begin_time, migration_id)
+                end_future = ex.submit(self._cached_acs_snapshot, end_time_query, migration_id)
+                acs_snapshot_begin = begin_future.result()
+                acs_snapshot_end = end_future.result()
             begin_time_snapshot = acs_snapshot_begin.get("record_time")
-            print(f"[DEBUG] begin_time_snapshot for {year}-{month:02d} is {begin_time_snapshot}", file=sys.stderr)
-
-            print(f"[DEBUG] Getting ACS snapshot timestamp for end_time_query={end_time_query} migration_id={migration_id}", file=sys.stderr)
-            acs_snapshot_end = self.get_acs_snapshot_timestamp(end_time_query, migration_id)
+            logger.debug("begin_time_snapshot for %s-%02d is %s", year, month, begin_time_snapshot)
             end_time_snapshot = acs_snapshot_end.get("record_time")
-            print(f"[DEBUG] end_time_snapshot for {year}-{month:02d} is {end_time_snapshot}", file=sys.stderr)
+            logger.debug("end_time_snapshot for %s-%02d is %s", year, month, end_time_snapshot)
             if not end_time_snapshot:
-                print(f"[WARN] No end_time found for {year}-{month:02d}", file=sys.stderr)
+                logger.warning("No end_time found for %s-%02d", year, month)
                 return []
 
-            # Call holdings summary at beginning and end
-            print(f"[DEBUG] Getting holdings summary at begin_time={begin_time}", file=sys.stderr)
-            begin_summary = self.get_holdings_summary_at_time(migration_id, begin_time, party_ids)
-            print(f"[DEBUG] Getting holdings summary at end_time={end_time_snapshot}", file=sys.stderr)
-            end_summary = self.get_holdings_summary_at_time(migration_id, end_time_snapshot, party_ids)
+            # Call holdings summary at beginning and end, also in parallel
+            logger.debug("Getting holdings summaries at begin_time=%s and end_time=%s", begin_time, end_time_snapshot)
+            with ThreadPoolExecutor(max_workers=2) as ex:
+                begin_future = ex.submit(self.get_holdings_summary_at_time, migration_id, begin_time, party_ids)
+                end_future = ex.submit(self.get_holdings_summary_at_time, migration_id, end_time_snapshot, party_ids)
+                begin_summary = begin_future.result()
+                end_summary = end_future.result()
 
             def extract_holdings(summary: dict) -> dict[str, Optional[str]]:
                 result = {}
@@ -978,12 +1737,16 @@ class ScanApiClient:
                     "year": year,
                     "month": month,
                 })
-            print(f"[INFO] Finished holdings summary for {year}-{month:02d}", file=sys.stderr)
+            logger.info("Finished holdings summary for %s-%02d", year, month)
             return result
 
+        # Months are independent; fan them out on a thread pool and reassemble
+        # in input order (results stay grouped by month as before).
         all_results: list[HoldingsSummaryForMonth] = []
-        for (y, m) in months:
-            all_results.extend(process_month(y, m))
+        if months:
+            with ThreadPoolExecutor(max_workers=min(8, len(months))) as ex:
+                for month_results in ex.map(lambda ym: process_month(*ym), months):
+                    all_results.extend(month_results)
 
         if csv_path:
             fieldnames = [
@@ -997,22 +1760,11 @@ class ScanApiClient:
                 "end_of_month_snapshot_time",
                 "end_of_month_balance",
             ]
-            with open(csv_path, "w", newline="") as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                for row in all_results:
-                    writer.writerow({
-                        "party_id": row["party_id"],
-                        "year": row["year"],
-                        "month": row["month"],
-                        "beginning_of_month_time": row["beginning_of_month_time"],
-                        "beginning_of_month_snapshot_time": row["beginning_of_month_snapshot_time"],
-                        "beginning_of_month_balance": row["beginning_of_month_balance"],
-                        "end_of_month_time": row["end_of_month_time"],
-                        "end_of_month_snapshot_time": row["end_of_month_snapshot_time"],
-                        "end_of_month_balance": row["end_of_month_balance"],
-                    })
-            print(f"[INFO] Wrote holdings summary for {len(months)} month(s) to {csv_path}", file=sys.stderr)
+            with open(csv_path, "w", newline="", buffering=1 << 20) as f:
+                writer = csv.writer(f)
+                writer.writerow(fieldnames)
+                writer.writerows([row[key] for key in fieldnames] for row in all_results)
+            logger.info("Wrote holdings summary for %s month(s) to %s", len(months), csv_path)
 
         return all_results
 
@@ -1029,11 +1781,22 @@ class ScanApiClient:
         Dynamically determines the max number of receivers and balance_changes and creates columns accordingly.
         Logs progress to stdout.
         """
-        import json
+        def _dump_text(v):
+            return _dumps(v).decode()
 
-        def flatten(d, max_receivers=0, max_balance_changes=0):
-            """Flattens a dict, expanding transfer.receivers and transfer.balance_changes up to max counts."""
+        def flatten(d, max_receivers=0, max_balance_changes=0, plan=None):
+            """
+            Flattens a dict, expanding transfer.receivers and transfer.balance_changes up to max counts.
+            When plan is given, records for each produced column the access path
+            used to read it, so the write loop can run specialized getters
+            instead of re-flattening every activity.
+            """
             items = {}
+
+            def note(key, path, json_blob=False):
+                if plan is not None and key not in plan:
+                    plan[key] = (path, json_blob)
+
             for k, v in d.items():
                 if k == "transfer" and isinstance(v, dict):
                     # Flatten transfer fields
@@ -1043,107 +1806,197 @@ class ScanApiClient:
                                 if i < len(tv) and isinstance(tv[i], dict):
                                     for rk, rv in tv[i].items():
                                         items[f"transfer_receivers_{i}_{rk}"] = rv
+                                        note(f"transfer_receivers_{i}_{rk}", ("transfer", "receivers", i, rk))
                                 else:
                                     # Fill empty columns if not enough receivers
-                                    for rk in ["party", "amount", "receiver_fee"]:
+                                    for rk in _RECEIVER_KEYS:
                                         items[f"transfer_receivers_{i}_{rk}"] = None
+                                        note(f"transfer_receivers_{i}_{rk}", ("transfer", "receivers", i, rk))
                             # Also store the full list as JSON
-                            items["transfer_receivers"] = json.dumps(tv)
+                            items["transfer_receivers"] = _dump_text(tv)
+                            note("transfer_receivers", ("transfer", "receivers"), True)
                         elif tk == "balance_changes" and isinstance(tv, list):
                             for i in range(max_balance_changes):
                                 if i < len(tv) and isinstance(tv[i], dict):
                                     for bk, bv in tv[i].items():
                                         items[f"transfer_balance_changes_{i}_{bk}"] = bv
+                                        note(f"transfer_balance_changes_{i}_{bk}", ("transfer", "balance_changes", i, bk))
                                 else:
-                                    for bk in ["party", "change_to_initial_amount_as_of_round_zero", "change_to_holding_fees_rate"]:
+                                    for bk in _BALANCE_CHANGE_KEYS:
                                         items[f"transfer_balance_changes_{i}_{bk}"] = None
-                            items["transfer_balance_changes"] = json.dumps(tv)
+                                        note(f"transfer_balance_changes_{i}_{bk}", ("transfer", "balance_changes", i, bk))
+                            items["transfer_balance_changes"] = _dump_text(tv)
+                            note("transfer_balance_changes", ("transfer", "balance_changes"), True)
                         elif isinstance(tv, dict):
                             for sk, sv in tv.items():
                                 items[f"transfer_{tk}_{sk}"] = sv
+                                note(f"transfer_{tk}_{sk}", ("transfer", tk, sk))
                         else:
                             items[f"transfer_{tk}"] = tv
+                            note(f"transfer_{tk}", ("transfer", tk))
                 elif isinstance(v, dict):
                     for sk, sv in v.items():
                         items[f"{k}_{sk}"] = sv
+                        note(f"{k}_{sk}", (k, sk))
                 elif isinstance(v, list):
-                    items[k] = json.dumps(v)
+                    items[k] = _dump_text(v)
+                    note(k, (k,), True)
                 else:
                     items[k] = v
+                    note(k, (k,))
             return items
 
-        # First pass: scan all activities to determine max receivers and balance_changes
-        begin_after_id = ""
-        total_scanned = 0
+        def _make_getter(path, json_blob):
+            def get(activity, _path=path, _json=json_blob):
+                v = activity
+                for p in _path:
+                    if isinstance(p, int):
+                        v = v[p] if isinstance(v, list) and p < len(v) else None
+                    elif isinstance(v, dict):
+                        v = v.get(p)
+                    else:
+                        v = None
+                    if v is None:
+                        return None
+                return _dump_text(v) if _json else v
+            return get
+
+        # Probe the first page to size the receiver/balance_changes columns and
+        # seed the header, then stream every page straight to the CSV.  Rows on
+        # later pages with more receivers than the probe saw keep their full
+        # data in the transfer_receivers/transfer_balance_changes JSON columns;
+        # fields the probe never saw at all land in the extra_fields column.
+        logger.info("Probing first page to determine columns...")
+        resp = self.list_activity({"page_size": page_size, "begin_after_id": ""})
+        activities = resp.get("activities", [])
         max_receivers = 0
         max_balance_changes = 0
-        all_flattened = []
-        print("Scanning activities to determine max receivers and balance_changes...")
+        plan: dict = {}
+        base_keys: dict = {}  # insertion-ordered set of base columns
+        for activity in activities:
+            transfer = activity.get("transfer")
+            if transfer:
+                max_receivers = max(max_receivers, len(transfer.get("receivers", [])))
+                max_balance_changes = max(max_balance_changes, len(transfer.get("balance_changes", [])))
+            for key in flatten(activity, plan=plan):
+                base_keys.setdefault(key)
+        # The schema is deterministic from the probe: base columns in
+        # first-seen order, then the templated receiver/balance-change
+        # columns generated arithmetically from the max counts.
+        fieldnames = list(base_keys)
+        for i in range(max_receivers):
+            for rk in _RECEIVER_KEYS:
+                key = f"transfer_receivers_{i}_{rk}"
+                fieldnames.append(key)
+                plan.setdefault(key, (("transfer", "receivers", i, rk), False))
+        for i in range(max_balance_changes):
+            for bk in _BALANCE_CHANGE_KEYS:
+                key = f"transfer_balance_changes_{i}_{bk}"
+                fieldnames.append(key)
+                plan.setdefault(key, (("transfer", "balance_changes", i, bk), False))
+        # The probe only sees the first page; activity shapes that first
+        # appear later (e.g. a mint's mint_amulet_* fields) have no planned
+        # column.  A trailing catch-all column keeps those values as JSON
+        # instead of silently dropping them.
+        fieldnames.append("extra_fields")
+
+        warned_keys: set = set()
+
+        def extra_fields(activity):
+            """Collect key/value pairs the probed plan has no column for."""
+            extra = None
+
+            def take(key, value):
+                nonlocal extra
+                if value is None:
+                    return
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+                if key not in warned_keys:
+                    warned_keys.add(key)
+                    logger.warning(
+                        "Field %r not seen on the probe page; preserving it in extra_fields",
+                        key,
+                    )
+
+            for k, v in activity.items():
+                if k == "transfer" and isinstance(v, dict):
+                    for tk, tv in v.items():
+                        if tk in ("receivers", "balance_changes") and isinstance(tv, list):
+                            # Overflow entries and novel sub-keys already live
+                            # in the transfer_receivers/transfer_balance_changes
+                            # JSON sidecars when those are planned.
+                            if f"transfer_{tk}" not in plan:
+                                take(f"transfer_{tk}", tv)
+                        elif isinstance(tv, dict):
+                            for sk, sv in tv.items():
+                                if f"transfer_{tk}_{sk}" not in plan:
+                                    take(f"transfer_{tk}_{sk}", sv)
+                        elif f"transfer_{tk}" not in plan:
+                            take(f"transfer_{tk}", tv)
+                elif isinstance(v, dict):
+                    for sk, sv in v.items():
+                        if f"{k}_{sk}" not in plan:
+                            take(f"{k}_{sk}", sv)
+                elif k not in plan:
+                    take(k, v)
+            return extra
+
+        # One specialized getter per column; the write loop below runs these
+        # instead of re-flattening every activity.
+        getters = [_make_getter(*plan[k]) for k in fieldnames[:-1]]
+        logger.info("Max receivers: %s, Max balance_changes: %s, columns: %s", max_receivers, max_balance_changes, len(fieldnames))
+
+        total_written = 0
         batch_num = 0
-        while True:
-            resp = self.list_activity({"page_size": page_size, "begin_after_id": begin_after_id})
-            activities = resp.get("activities", [])
-            if not activities:
-                print(f"No more activities after batch {batch_num}.")
-                break
-            stopped = False
-            print(f"Processing batch {batch_num}, activities in batch: {len(activities)}, total scanned so far: {total_scanned}")
-            for idx, activity in enumerate(activities):
-                if idx > 0 and idx % 1000 == 0:
-                    print(f"  ...processed {idx} activities in current batch...")
-                activity_date = activity.get("date")
-                if activity_date and activity_date < after_timestamp:
-                    print(f"Stopping scan at activity_date={activity_date} (before after_timestamp={after_timestamp})")
-                    print(f"Total scanned before stop: {total_scanned}")
-                    print(f"Activity: {activity}")
-                    stopped = True
+        # One reusable row buffer: writerow serializes immediately, so the
+        # same list can be refilled slot by slot instead of allocating a
+        # fresh wide list per activity.
+        row_buf: list = [None] * (len(getters) + 1)
+        getter_slots = list(enumerate(getters))
+        extra_slot = len(getters)
+
+        def fill_row(activity):
+            for i, g in getter_slots:
+                row_buf[i] = g(activity)
+            extra = extra_fields(activity)
+            row_buf[extra_slot] = _dump_text(extra) if extra else None
+        with open(csv_path, "w", newline="", buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            while activities:
+                stopped = False
+                logger.info("Processing batch %s, activities in batch: %s, total written so far: %s", batch_num, len(activities), total_written)
+                # Pages are ordered newest-to-oldest, so one look at the
+                # oldest entry decides whether the cutoff can fall inside
+                # this page; only the boundary page pays the per-row check.
+                oldest_date = activities[-1].get("date")
+                if oldest_date and oldest_date >= after_timestamp:
+                    for activity in activities:
+                        fill_row(activity)
+                        writer.writerow(row_buf)
+                    total_written += len(activities)
+                else:
+                    for activity in activities:
+                        activity_date = activity.get("date")
+                        if activity_date and activity_date < after_timestamp:
+                            logger.info("Stopping at activity_date=%s (before after_timestamp=%s)", activity_date, after_timestamp)
+                            stopped = True
+                            break
+                        fill_row(activity)
+                        writer.writerow(row_buf)
+                        total_written += 1
+                if stopped:
                     break
-                transfer = activity.get("transfer")
-                if transfer:
-                    receivers = transfer.get("receivers", [])
-                    balance_changes = transfer.get("balance_changes", [])
-                    max_receivers = max(max_receivers, len(receivers))
-                    max_balance_changes = max(max_balance_changes, len(balance_changes))
-                all_flattened.append(activity)
-                total_scanned += 1
-            if stopped:
-                print(f"Stopped scanning batch {batch_num} at activity_date={activity_date}")
-                break
-            begin_after_id = activities[-1].get("event_id") if activities else None
-            batch_num += 1
-            if not begin_after_id or (activities and activities[-1].get("date") and activities[-1].get("date") < after_timestamp):
-                if activities and activities[-1].get("date") and activities[-1].get("date") < after_timestamp:
-                    print(f"Breaking batch loop at last activity_date={activities[-1].get('date')} (before after_timestamp={after_timestamp})")
-                print("breaking batch loop at last activity_date")
-                break
-        print(f"Max receivers: {max_receivers}, Max balance_changes: {max_balance_changes}, Total activities: {total_scanned}")
-
-        # Second pass: flatten and write to CSV
-        def get_all_fieldnames():
-            # Build a superset of all possible keys
-            fieldnames = set()
-            for activity in all_flattened:
-                flat = flatten(activity, max_receivers, max_balance_changes)
-                fieldnames.update(flat.keys())
-            return sorted(fieldnames)
-
-        fieldnames = get_all_fieldnames()
-        print(f"Writing CSV with {len(fieldnames)} columns...")
-
-        with open(csv_path, "w", newline="") as f:
-            import csv
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            written = 0
-            for activity in all_flattened:
-                activity_date = activity.get("date")
-                if activity_date and activity_date < after_timestamp:
-                    print(f"Stopping CSV write at activity_date={activity_date} (before after_timestamp={after_timestamp})")
+                begin_after_id = activities[-1].get("event_id")
+                if not begin_after_id:
+                    logger.info("breaking batch loop: no event_id on last activity")
                     break
-                flat = flatten(activity, max_receivers, max_balance_changes)
-                writer.writerow(flat)
-                written += 1
-            print(f"Done. Total activities written: {written}")
+                batch_num += 1
+                resp = self.list_activity({"page_size": page_size, "begin_after_id": begin_after_id})
+                activities = resp.get("activities", [])
+            logger.info("Done. Total activities written: %s", total_written)
 
     def list_all_validator_licenses(self) -> list[ValidatorLicense]:
         """
@@ -1197,35 +2050,48 @@ class ScanApiClient:
         latest_data = self.get_round_of_latest_data()
         latest_round = latest_data.get("round")
         if latest_round is None:
-            print("Could not determine latest round.")
+            logger.info("Could not determine latest round.")
             return
 
         written_header = False
         total_entries = 0
-        print(f"Exporting round party totals from round {start_round} to {latest_round} in batches of {batch_size}...")
-        with open(csv_path, "w", newline="") as f:
+        batch_starts = list(range(start_round, latest_round + 1, batch_size))
+        logger.info("Exporting round party totals from round %s to %s in batches of %s...", start_round, latest_round, batch_size)
+        with open(csv_path, "w", newline="", buffering=1 << 20) as f, \
+                ThreadPoolExecutor(max_workers=4) as ex:
             writer = None
-            for batch_start in range(start_round, latest_round + 1, batch_size):
+
+            def submit(batch_start: int):
+                # The party-totals page and the round-totals page for the same
+                # range are independent; fetch them as a concurrent pair.
                 batch_end = min(batch_start + batch_size - 1, latest_round)
-                print(f"Fetching rounds {batch_start} to {batch_end}...")
-                resp = self.list_round_party_totals(batch_start, batch_end)
+                return (
+                    batch_start,
+                    batch_end,
+                    ex.submit(self.list_round_party_totals, batch_start, batch_end),
+                    ex.submit(self._cached_round_totals_batch, batch_start, batch_end),
+                )
+
+            # One-batch-ahead pipeline: while the current batch is written,
+            # the next batch's two fetches are already in flight.  Depth is
+            # bounded at two outstanding batches to cap memory.
+            pending = [submit(bs) for bs in batch_starts[:2]]
+            next_idx = 2
+            while pending:
+                batch_start, batch_end, totals_future, round_totals_future = pending.pop(0)
+                logger.info("Fetching rounds %s to %s...", batch_start, batch_end)
+                resp = totals_future.result()
+                round_totals = round_totals_future.result()
+                if next_idx < len(batch_starts):
+                    pending.append(submit(batch_starts[next_idx]))
+                    next_idx += 1
                 entries = resp.get("entries", [])
                 if not entries:
-                    print(f"No entries for rounds {batch_start} to {batch_end}.")
+                    logger.info("No entries for rounds %s to %s.", batch_start, batch_end)
                     continue
 
                 # Build a map of closed_round -> effective_time for this batch
-                round_to_effective_time = {}
-                round_totals = self.list_round_totals(batch_start, batch_end)
-                for rt in round_totals:
-                    round_num = rt.get("closed_round")
-                    eff_time = (
-                        rt.get("closed_round_effective_at")
-                        or rt.get("effectiveAt")
-                        or rt.get("effective_at")
-                    )
-                    if round_num is not None and eff_time:
-                        round_to_effective_time[round_num] = eff_time
+                round_to_effective_time = _round_effective_times(round_totals)
 
                 # Add effective_time to each entry
                 for entry in entries:
@@ -1236,19 +2102,20 @@ class ScanApiClient:
                     fieldnames = list(entries[0].keys())
                     if "effective_time" not in fieldnames:
                         fieldnames.append("effective_time")
-                    writer = csv.DictWriter(f, fieldnames=fieldnames)
-                    writer.writeheader()
+                    writer = csv.writer(f)
+                    writer.writerow(fieldnames)
                     written_header = True
-                for entry in entries:
-                    writer.writerow(entry)
+                writer.writerows([entry.get(key) for key in fieldnames] for entry in entries)
                 total_entries += len(entries)
-                print(f"Wrote {len(entries)} entries for rounds {batch_start} to {batch_end} (total so far: {total_entries})")
-        print(f"Done writing all round_party_totals to CSV. Total entries: {total_entries}")
+                logger.info("Wrote %s entries for rounds %s to %s (total so far: %s)", len(entries), batch_start, batch_end, total_entries)
+        logger.info("Done writing all round_party_totals to CSV. Total entries: %s", total_entries)
         
     def get_wallet_balance_last_10_rounds(
         self,
         party_id: str,
         csv: bool = False,
+        max_workers: int = 16,
+        use_batch: bool = True,
     ) -> List[Dict[str, Any]]:
         """
         Get wallet balance for the last 10 rounds for a given party_id.
@@ -1263,44 +2130,34 @@ class ScanApiClient:
                 - effective_time: The effective time of the round
                 - wallet_balance: The wallet balance for that round
         """
-        import sys
         
         # Get the latest round
-        print(f"[INFO] Getting latest round data...", file=sys.stderr)
+        logger.info("Getting latest round data...")
         latest_data = self.get_round_of_latest_data()
         latest_round = latest_data.get("round")
         
         if latest_round is None:
-            print(f"[ERROR] Could not determine latest round", file=sys.stderr)
+            logger.error("Could not determine latest round")
             return []
         
         # Calculate the starting round (10 rounds back from latest)
         start_round = max(0, latest_round - 9)  # -9 because we want 10 rounds including the latest
         
-        print(f"[INFO] Fetching wallet balances for party_id={party_id} for rounds {start_round} to {latest_round}", file=sys.stderr)
+        logger.info("Fetching wallet balances for party_id=%s for rounds %s to %s", party_id, start_round, latest_round)
         
         # Get effective times for the rounds
-        round_to_effective_time = {}
-        entries = self.list_round_totals(start_round, latest_round)
-        for entry in entries:
-            round_num = entry.get("closed_round")
-            eff_time = (
-                entry.get("closed_round_effective_at")
-                or entry.get("effectiveAt")
-                or entry.get("effective_at")
-            )
-            if round_num is not None and eff_time:
-                round_to_effective_time[round_num] = eff_time
+        round_to_effective_time = self._ensure_effective_times(start_round, latest_round)
         
-        # Get wallet balance for each round
+        # Get wallet balance for each round, in parallel
+        rounds = range(start_round, latest_round + 1)
+        rows = self._wallet_balance_rows(
+            party_id, rounds, round_to_effective_time, use_batch, max_workers
+        )
+
         results = []
-        for round_num in range(start_round, latest_round + 1):
-            balance_resp = self.get_wallet_balance(party_id, round_num)
-            wallet_balance = balance_resp.get("wallet_balance")
-            effective_time = round_to_effective_time.get(round_num)
-            
-            print(f"[DEBUG] round={round_num}, effective_time={effective_time}, wallet_balance={wallet_balance}", file=sys.stderr)
-            
+        for round_num, effective_time, wallet_balance in rows:
+            logger.debug("round=%s, effective_time=%s, wallet_balance=%s", round_num, effective_time, wallet_balance)
+
             results.append({
                 "round": round_num,
                 "effective_time": effective_time,
@@ -1308,17 +2165,18 @@ class ScanApiClient:
             })
         
         if csv:
-            import csv as _csv
             party_short = party_id.split("::")[0]
             filename = f"wallet_balance_last_10_rounds_{party_short}.csv"
-            print(f"[INFO] Writing results to {filename}", file=sys.stderr)
-            with open(filename, "w", newline="") as f:
-                writer = _csv.DictWriter(f, fieldnames=["round", "effective_time", "wallet_balance"])
-                writer.writeheader()
-                for row in results:
-                    writer.writerow(row)
+            logger.info("Writing results to %s", filename)
+            with open(filename, "w", newline="", buffering=1 << 20) as f:
+                writer = _csv.writer(f)
+                writer.writerow(["round", "effective_time", "wallet_balance"])
+                # rows is already columnar-ordered (round, effective_time,
+                # wallet_balance) tuples; write it directly rather than going
+                # back through the result dicts.
+                writer.writerows(rows)
         
-        print(f"[INFO] Done fetching wallet balance for last 10 rounds", file=sys.stderr)
+        logger.info("Done fetching wallet balance for last 10 rounds")
         return results
 
     def get_holdings_summary_now(
@@ -1359,7 +2217,7 @@ class ScanApiClient:
         snapshot_time = acs_snapshot.get("record_time")
 
         if not snapshot_time:
-            print(f"[WARN] No ACS snapshot found for current time, using current time directly", file=sys.stderr)
+            logger.warning("No ACS snapshot found for current time, using current time directly")
             snapshot_time = current_time
 
 
@@ -1377,4 +2235,216 @@ class ScanApiClient:
         if owner_party_ids is not None:
             data["owner_party_ids"] = owner_party_ids
 
-        return self.session.post(f"{self.base_url}/v0/holdings/summary", json=data).json()
\ No newline at end of file
+        return self._json(self._post_raw(self._url.holdings_summary, _dumps(data)))
+
+class AsyncScanApiClient:
+    """
+    Async variant of ScanApiClient built on httpx with HTTP/2, so fan-out
+    heavy flows (month searches, per-party balance sweeps) multiplex dozens
+    of in-flight requests over one connection instead of serial round-trips.
+    Covers the hot read endpoints; use ScanApiClient for the full surface.
+    Requires the optional httpx dependency (pip install httpx[http2]).
+    Use as an async context manager or call aclose() when done.
+    """
+
+    _ROUND_BATCH_SIZE = ScanApiClient._ROUND_BATCH_SIZE
+
+    def __init__(self, base_url: str, token: Optional[str] = None):
+        if httpx is None:
+            raise ImportError("AsyncScanApiClient requires the httpx package")
+        self._client = httpx.AsyncClient(
+            base_url=base_url.rstrip("/"),
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=30.0,
+            headers={"Authorization": f"Bearer {token}"} if token else None,
+        )
+
+    async def __aenter__(self) -> "AsyncScanApiClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def _get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        r = await self._client.get(path, params=params)
+        return _loads(r.content)
+
+    async def _post(self, path: str, data: Dict[str, Any]) -> Any:
+        r = await self._client.post(path, content=_dumps(data), headers=_JSON_HEADERS)
+        return _loads(r.content)
+
+    async def readyz(self) -> Dict[str, Any]:
+        """GET /readyz - Health check."""
+        return await self._get("/readyz")
+
+    async def livez(self) -> Dict[str, Any]:
+        """GET /livez - Liveness check."""
+        return await self._get("/livez")
+
+    async def status(self) -> Dict[str, Any]:
+        """GET /status - Status info."""
+        return await self._get("/status")
+
+    async def get_round_of_latest_data(self) -> RoundOfLatestDataResponse:
+        """GET /v0/round-of-latest-data - Get round of latest data."""
+        return await self._get("/v0/round-of-latest-data")
+
+    async def get_wallet_balance(self, party_id: str, as_of_end_of_round: int) -> WalletBalanceResponse:
+        """
+        GET /v0/wallet-balance
+        Input: party_id (str), as_of_end_of_round (int)
+        Output: JSON with wallet balance.
+        """
+        params = {"party_id": party_id, "asOfEndOfRound": as_of_end_of_round}
+        return await self._get("/v0/wallet-balance", params=params)
+
+    async def list_round_totals(self, start_round: int, end_round: int) -> list[RoundTotalEntry]:
+        """
+        POST /v0/round-totals
+        Input: start_round (int), end_round (int)
+        Output: List of round totals between start_round and end_round (inclusive).
+        """
+        data = {"start_round": start_round, "end_round": end_round}
+        response = await self._post("/v0/round-totals", data)
+        return response.get("entries", [])
+
+    async def get_acs_snapshot_timestamp(self, before: str, migration_id: int) -> Dict[str, Any]:
+        """
+        GET /v0/state/acs/snapshot-timestamp
+        Input: before (str), migration_id (int)
+        Output: JSON with snapshot timestamp.
+        """
+        params = {"before": before, "migration_id": migration_id}
+        return await self._get("/v0/state/acs/snapshot-timestamp", params=params)
+
+    async def get_holdings_summary_at_time(
+        self,
+        migration_id: Optional[int] = None,
+        record_time: Optional[str] = None,
+        owner_party_ids: Optional[list[str]] = None,
+        as_of_round: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        POST /v0/holdings/summary
+        Input: migration_id (int), record_time (str, optional), owner_party_ids (list[str], optional), as_of_round (int, optional)
+        Output: JSON with holdings summary.
+        """
+        data: Dict[str, Any] = {"migration_id": migration_id}
+        if record_time is not None:
+            data["record_time"] = record_time
+        if owner_party_ids is not None:
+            data["owner_party_ids"] = owner_party_ids
+        if as_of_round is not None:
+            data["as_of_round"] = as_of_round
+        return await self._post("/v0/holdings/summary", data)
+
+    async def find_rounds_for_month(self, year: int, month: int) -> Optional[FindRoundsForMonthResult]:
+        """
+        Async twin of ScanApiClient.find_rounds_for_month: the same batched
+        binary search, with the boundary probes multiplexed via gather.
+        """
+        latest_data = await self.get_round_of_latest_data()
+        latest_round = latest_data.get("round")
+        if latest_round is None:
+            return None
+
+        batch_size = self._ROUND_BATCH_SIZE
+        batch_cache: Dict[int, Tuple[Optional[Tuple[str, int, int]], ...]] = {}
+        target_ym = (year, month)
+
+        async def get_row(round_num: int) -> Optional[Tuple[str, int, int]]:
+            batch_start = (round_num // batch_size) * batch_size
+            batch_end = min(batch_start + batch_size - 1, latest_round)
+            if round_num > batch_end:
+                return None
+            rows = batch_cache.get(batch_start)
+            if rows is None:
+                rows_list: List[Optional[Tuple[str, int, int]]] = [None] * (batch_end - batch_start + 1)
+                entries = await self.list_round_totals(batch_start, batch_end)
+                eff_key = _effective_at_key(entries)
+                for entry in entries:
+                    rn = entry.get("closed_round")
+                    eff = entry.get(eff_key) if eff_key else None
+                    if rn is None or not eff or not (batch_start <= rn <= batch_end):
+                        continue
+                    try:
+                        ym = (int(eff[0:4]), int(eff[5:7]))
+                    except ValueError:
+                        continue
+                    rows_list[rn - batch_start] = (eff, ym[0], ym[1])
+                rows = tuple(rows_list)
+                batch_cache[batch_start] = rows
+            return rows[round_num - batch_start]
+
+        async def search(find_first: bool) -> Optional[int]:
+            left, right = 0, latest_round
+            best = None
+            while left <= right:
+                mid = (left + right) // 2
+                row = await get_row(mid)
+                ym = (row[1], row[2]) if row else None
+                if ym is None:
+                    left = mid + 1
+                elif ym < target_ym:
+                    left = mid + 1
+                elif ym > target_ym:
+                    right = mid - 1
+                elif find_first:
+                    best = mid
+                    right = mid - 1
+                else:
+                    best = mid
+                    left = mid + 1
+            return best
+
+        first_in_month, last_in_month = await asyncio.gather(search(True), search(False))
+        if first_in_month is None:
+            return None
+        if last_in_month is None:
+            last_in_month = first_in_month
+
+        first_row = await get_row(first_in_month)
+        last_row = await get_row(last_in_month)
+        return {
+            "start_round": first_in_month,
+            "start_time": first_row[0] if first_row else None,
+            "end_round": last_in_month,
+            "end_time": last_row[0] if last_row else None,
+        }
+
+    async def get_wallet_balances_for_month_from_rounds_estimate(
+        self, party_ids: list[str], year: int, month: int
+    ) -> list[WalletBalanceForMonth]:
+        """
+        For each party_id, get wallet balance at the beginning and end of the
+        given month. All per-party lookups are issued as one gather burst.
+        """
+        result: list[WalletBalanceForMonth] = []
+        rounds = await self.find_rounds_for_month(year, month)
+        if not rounds:
+            return result
+        start_round = rounds["start_round"]
+        end_round = rounds["end_round"]
+
+        balances = await asyncio.gather(
+            *[self.get_wallet_balance(p, start_round) for p in party_ids],
+            *[self.get_wallet_balance(p, end_round) for p in party_ids],
+        )
+        begin_balances = balances[:len(party_ids)]
+        end_balances = balances[len(party_ids):]
+
+        for party_id, begin_resp, end_resp in zip(party_ids, begin_balances, end_balances):
+            result.append({
+                "party_id": party_id,
+                "beginning_of_month_round": start_round,
+                "beginning_of_month_time": rounds["start_time"],
+                "beginning_of_month_balance": begin_resp.get("wallet_balance"),
+                "end_of_month_round": end_round,
+                "end_of_month_time": rounds["end_time"],
+                "end_of_month_balance": end_resp.get("wallet_balance"),
+            })
+        return result